@@ -0,0 +1,392 @@
+"""
+Benchmark harness for the Assignments solvers.
+
+Each problem has a generator that builds a max-constraint (worst-case) input.
+The runner launches the solver as a subprocess with that input piped to stdin,
+repeats the run a few times, and records wall-clock time and peak RSS of the
+child process.  Results are written as JSON so two runs (before / after a
+change) can be diffed instead of guessed at.
+
+Usage:
+    python Assignments/benchmark.py                     # every problem
+    python Assignments/benchmark.py doorman nikola      # just these
+    python Assignments/benchmark.py -r 10 -o out.json   # 10 repeats, custom file
+    python Assignments/benchmark.py --list              # show problem names
+
+Peak RSS is reported in KiB.  On Linux the solver runs under a small launcher
+that reads VmHWM from /proc/self/status when it finishes; ru_maxrss from
+os.wait4() is not usable there because it also counts the pages the child
+inherited from this (much bigger) process before exec.  Elsewhere the
+ru_maxrss value is used as-is (note: macOS reports it in bytes).
+"""
+import argparse
+import json
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Runs the solver as __main__ (sys.path[0] = its directory, like a normal
+# script run) and reports the high-water mark of its own address space.
+_LAUNCHER = """
+import os, runpy, sys
+solver = sys.argv[1]
+sys.argv = sys.argv[1:]
+sys.path[0] = os.path.dirname(solver)
+try:
+    runpy.run_path(solver, run_name='__main__')
+finally:
+    with open('/proc/self/status') as fh:
+        for line in fh:
+            if line.startswith('VmHWM:'):
+                sys.stderr.write('\\n' + line)
+"""
+_HWM = re.compile(rb'^VmHWM:\s*(\d+) kB', re.M)
+USE_PROC = os.path.exists('/proc/self/status')
+
+LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+
+
+# ============================================================================
+# Worst-case input generators: each takes a random.Random and returns bytes
+# ============================================================================
+
+def gen_carrots(rng):
+    n = 1000
+    lines = ['%d %d' % (n, rng.randint(0, 1000))]
+    lines += [''.join(rng.choice(LETTERS) for _ in range(20)) for _ in range(n)]
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def gen_different(rng):
+    lines = ['%d %d' % (rng.randint(0, 10**15), rng.randint(0, 10**15))
+             for _ in range(100000)]
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def gen_erase(rng):
+    bits = ''.join(rng.choice('01') for _ in range(1000))
+    flipped = bits.translate(str.maketrans('01', '10'))
+    return ('19\n%s\n%s\n' % (bits, flipped)).encode()
+
+
+def gen_helpaphd(rng):
+    n = 1000
+    lines = [str(n)]
+    for _ in range(n):
+        if rng.random() < 0.1:
+            lines.append('P=NP')
+        else:
+            lines.append('%d+%d' % (rng.randint(0, 1000), rng.randint(0, 1000)))
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def gen_leftbeehind(rng):
+    lines = ['%d %d' % (rng.randint(1, 1000), rng.randint(1, 1000))
+             for _ in range(100000)]
+    lines.append('0 0')
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def gen_permutationencryption(rng):
+    lines = []
+    for _ in range(10000):
+        n = rng.randint(1, 20)
+        key = list(range(1, n + 1))
+        rng.shuffle(key)
+        lines.append(' '.join(map(str, [n] + key)))
+        lines.append(''.join(rng.choice(LETTERS + ' ') for _ in range(80)))
+    lines.append('0')
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def gen_pvbg(rng):
+    n = 100000
+    nums = ' '.join(str(rng.randint(1, 10**9)) for _ in range(n))
+    return ('%d\n%s\n' % (n, nums)).encode()
+
+
+def gen_quickbrownfox(rng):
+    n = 10000
+    pool = LETTERS + LETTERS.upper() + ' .,?!\'"'
+    lines = [str(n)]
+    lines += [''.join(rng.choice(pool) for _ in range(100)) for _ in range(n)]
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def gen_simpleaddition(rng):
+    a = str(rng.randint(1, 9)) + ''.join(rng.choice('0123456789') for _ in range(10**6 - 1))
+    b = str(rng.randint(1, 9)) + ''.join(rng.choice('0123456789') for _ in range(10**6 - 1))
+    return ('%s\n%s\n' % (a, b)).encode()
+
+
+def gen_timebomb(rng):
+    rows = [
+        "***   * *** *** * * *** *** *** *** ***",
+        "* *   *   *   * * * *   *     * * * * *",
+        "* *   * *** *** *** *** ***   * *** ***",
+        "* *   * *     *   *   * * *   * * *   *",
+        "***   * *** ***   * *** ***   * *** ***",
+    ]
+    digits = [rng.randint(0, 9) for _ in range(8)]
+    block = [' '.join(rows[r][d * 4:d * 4 + 3] for d in digits) for r in range(5)]
+    return ('\n'.join(block) + '\n').encode()
+
+
+def gen_backspace(rng):
+    chars = [rng.choice(LETTERS) if rng.random() < 0.7 else '<' for _ in range(10**6)]
+    chars[0] = 'a'
+    return (''.join(chars) + '\n').encode()
+
+
+def gen_countingstars(rng):
+    lines = []
+    for density in (1.0, 0.9, 0.6, 0.5):
+        lines.append('100 100')
+        for _ in range(100):
+            lines.append(''.join('-' if rng.random() < density else '#'
+                                 for _ in range(100)))
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def gen_deduplicatingfiles(rng):
+    lines = []
+    for _ in range(10):
+        n = 10000
+        lines.append(str(n))
+        distinct = [''.join(rng.choice(LETTERS + ' .') for _ in range(rng.randint(1, 80)))
+                    for _ in range(n // 2)]
+        lines += [rng.choice(distinct) for _ in range(n)]
+    lines.append('0')
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def gen_doorman(rng):
+    # random walk kept inside |#W - #M| <= X, so everybody gets in and the
+    # whole queue has to be scanned
+    x = 100
+    diff = 0
+    queue = []
+    for _ in range(10**6):
+        if diff >= x:
+            step = -1
+        elif diff <= -x:
+            step = 1
+        else:
+            step = rng.choice((1, -1))
+        diff += step
+        queue.append('W' if step == 1 else 'M')
+    return ('%d\n%s\n' % (x, ''.join(queue))).encode()
+
+
+def gen_restaurant(rng):
+    lines = []
+    for _ in range(10):
+        n = 1000
+        lines.append(str(n))
+        plates = 0
+        for _ in range(n):
+            if plates == 0 or rng.random() < 0.5:
+                m = rng.randint(1, 100000)
+                plates += m
+                lines.append('DROP %d' % m)
+            else:
+                m = rng.randint(1, plates)
+                plates -= m
+                lines.append('TAKE %d' % m)
+    lines.append('0')
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def gen_commercials(rng):
+    n = 100000
+    students = ' '.join(str(rng.randint(0, 2000)) for _ in range(n))
+    return ('%d %d\n%s\n' % (n, rng.randint(1, 1000), students)).encode()
+
+
+def gen_narrowartgallery(rng):
+    n = 200
+    lines = ['%d %d' % (n, n)]
+    lines += ['%d %d' % (rng.randint(0, 100), rng.randint(0, 100)) for _ in range(n)]
+    lines.append('0 0')
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def gen_nikola(rng):
+    n = 1000
+    lines = [str(n)] + [str(rng.randint(1, 500)) for _ in range(n)]
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def gen_pebblesolitaire2(rng):
+    n = 1000
+    lines = [str(n)]
+    lines += [''.join(rng.choice('o-') for _ in range(23)) for _ in range(n)]
+    return ('\n'.join(lines) + '\n').encode()
+
+
+# problem name -> (solver path relative to Assignments/, generator)
+PROBLEMS = {
+    'carrots': ('hw1/carrots.py', gen_carrots),
+    'different': ('hw1/different.py', gen_different),
+    'erase': ('hw1/erase.py', gen_erase),
+    'helpaphd': ('hw1/helpaphd.py', gen_helpaphd),
+    'leftbeehind': ('hw1/leftbeehind.py', gen_leftbeehind),
+    'permutationencryption': ('hw1/permutationencryption.py', gen_permutationencryption),
+    'pvbg': ('hw1/pvbg.py', gen_pvbg),
+    'quickbrownfox': ('hw1/quickbrownfox.py', gen_quickbrownfox),
+    'simpleaddition': ('hw1/simpleaddition.py', gen_simpleaddition),
+    'timebomb': ('hw1/timebomb.py', gen_timebomb),
+    'backspace': ('hw2/backspace.py', gen_backspace),
+    'countingstars': ('hw2/countingstars.py', gen_countingstars),
+    'deduplicatingfiles': ('hw2/deduplicatingfiles.py', gen_deduplicatingfiles),
+    'doorman': ('hw2/doorman.py', gen_doorman),
+    'restaurant': ('hw2/restaurant.py', gen_restaurant),
+    'commercials': ('hw4/commercials.py', gen_commercials),
+    'narrowartgallery': ('hw4/narrowartgallery.py', gen_narrowartgallery),
+    'nikola': ('hw4/nikola.py', gen_nikola),
+    'pebblesolitaire2': ('hw4/pebblesolitaire2.py', gen_pebblesolitaire2),
+}
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+def run_once(solver, data, timeout=None):
+    """
+    Run one solver process with data piped to stdin.
+
+    stdin is fed from a helper thread, so timeout also covers a solver
+    that stops reading its input (it is killed, and the write fails).
+
+    Returns:
+        dict with wall time (s), peak RSS (KiB, None when it is unknown),
+        exit code, whether the run timed out, and the tail of stderr if
+        the run failed
+    """
+    if USE_PROC:
+        cmd = [sys.executable, '-c', _LAUNCHER, solver]
+    else:
+        cmd = [sys.executable, solver]
+    with tempfile.TemporaryFile() as err:
+        start = time.perf_counter()
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                                stdout=subprocess.DEVNULL, stderr=err)
+
+        def feed():
+            # inputs are far bigger than the pipe buffer, so this blocks
+            # until the solver reads; keep it off the thread that enforces
+            # the deadline
+            try:
+                proc.stdin.write(data)
+                proc.stdin.close()
+            except (BrokenPipeError, OSError):
+                pass  # solver exited (or was killed) without reading everything
+
+        feeder = threading.Thread(target=feed, daemon=True)
+        feeder.start()
+
+        deadline = None if timeout is None else start + timeout
+        timed_out = False
+        while True:
+            pid, status, usage = os.wait4(proc.pid, os.WNOHANG if deadline else 0)
+            if pid:
+                break
+            if time.perf_counter() > deadline:
+                proc.kill()
+                timed_out = True
+                pid, status, usage = os.wait4(proc.pid, 0)
+                break
+            time.sleep(0.005)
+        wall = time.perf_counter() - start
+        proc.returncode = code = os.waitstatus_to_exitcode(status)
+        feeder.join()
+
+        err.seek(0)
+        errors = err.read()
+        # a killed run never reaches the launcher's VmHWM report, and its
+        # ru_maxrss is the inflated value the docstring warns about
+        if timed_out:
+            max_rss = None
+        elif USE_PROC:
+            hwm = _HWM.search(errors)
+            max_rss = int(hwm.group(1)) if hwm else None
+        else:
+            max_rss = usage.ru_maxrss
+
+        result = {'wall': wall, 'max_rss': max_rss, 'returncode': code,
+                  'timed_out': timed_out}
+        if code != 0:
+            result['stderr'] = _HWM.sub(b'', errors)[-500:].decode(errors='replace')
+        return result
+
+
+def bench_problem(name, repeats=5, seed=0, timeout=None):
+    """Generate the worst-case input for one problem and time its solver."""
+    rel, gen = PROBLEMS[name]
+    data = gen(random.Random(seed))
+    solver = os.path.join(HERE, rel)
+
+    runs = [run_once(solver, data, timeout) for _ in range(repeats)]
+    walls = [r['wall'] for r in runs]
+    rss = [r['max_rss'] for r in runs if r['max_rss'] is not None]
+    return {
+        'solver': rel,
+        'input_bytes': len(data),
+        'repeats': repeats,
+        'wall_min': min(walls),
+        'wall_median': statistics.median(walls),
+        'max_rss': max(rss) if rss else None,
+        'timeouts': sum(r['timed_out'] for r in runs),
+        'ok': all(r['returncode'] == 0 for r in runs),
+        'runs': runs,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('problems', nargs='*', help='problem names (default: all)')
+    parser.add_argument('-r', '--repeats', type=int, default=5)
+    parser.add_argument('-s', '--seed', type=int, default=0)
+    parser.add_argument('-t', '--timeout', type=float, default=None,
+                        help='kill a run after this many seconds')
+    parser.add_argument('-o', '--output', default='bench_results.json')
+    parser.add_argument('--list', action='store_true', help='list problems and exit')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (rel, _) in PROBLEMS.items():
+            print(f"{name:24s} {rel}")
+        return
+
+    names = args.problems or list(PROBLEMS)
+    unknown = [name for name in names if name not in PROBLEMS]
+    if unknown:
+        parser.error(f"unknown problem(s): {', '.join(unknown)}")
+
+    results = {}
+    for name in names:
+        res = bench_problem(name, args.repeats, args.seed, args.timeout)
+        results[name] = res
+        status = 'ok' if res['ok'] else 'FAILED'
+        if res['timeouts']:
+            status += f" ({res['timeouts']} timed out)"
+        rss = '-' if res['max_rss'] is None else res['max_rss']
+        print(f"{name:24s} {res['wall_median']:8.3f}s median  "
+              f"{res['wall_min']:8.3f}s min  {rss:>8} maxrss  {status}")
+
+    with open(args.output, 'w') as fh:
+        json.dump(results, fh, indent=2)
+    print(f"\nWrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
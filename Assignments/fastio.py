@@ -0,0 +1,204 @@
+"""
+Shared fast I/O for the Assignments solvers.
+
+hw1/fastio.py measured the win from swapping input() for sys.stdin.readline.
+This module goes further: stdin is read exactly once as raw bytes (or mmapped
+when it is redirected from a regular file) and tokens / lines are handed out
+lazily straight from that buffer, so nothing is decoded to str and no big
+split() list is built.
+
+Use it from a solver in Assignments/hwN/ like this:
+
+    import os, sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from fastio import Reader, Writer
+
+    r = Reader()
+    out = Writer()
+    n = r.int()
+    nums = r.ints(n)
+    out.int(sum(nums))
+
+Mixing token and line reads follows readline() semantics: after r.int()
+the rest of that line (usually just the newline) is what r.line() returns.
+
+Output goes the other way: Writer collects everything in one bytearray and
+only touches sys.stdout.buffer when that passes a size threshold (and once
+more at exit), instead of paying for a print() call per line.  Don't mix it
+with print() in the same program -- the two buffers would interleave badly.
+"""
+import atexit
+import mmap
+import os
+import re
+import stat
+import sys
+from array import array
+from itertools import islice
+
+_TOKEN = re.compile(rb'\S+')
+
+
+def _load(stream):
+    """Return the whole stream as a bytes-like buffer (mmap for regular files)."""
+    try:
+        fd = stream.fileno()
+        info = os.fstat(fd)
+        if stat.S_ISREG(info.st_mode) and info.st_size > 0:
+            return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        pass
+    return stream.read()
+
+
+def read_chunks(stream=None, size=1 << 16):
+    """
+    Yield the rest of a binary stream (default sys.stdin.buffer) in chunks of
+    at most `size` bytes, for inputs too long to hold in memory at once.
+    """
+    stream = sys.stdin.buffer if stream is None else stream
+    while True:
+        chunk = stream.read(size)
+        if not chunk:
+            return
+        yield chunk
+
+
+class Reader:
+    """Lazy token / line reader over a single bytes buffer."""
+
+    def __init__(self, data=None):
+        """
+        Args:
+            data: bytes to read from (mainly for testing by hand);
+                  defaults to all of sys.stdin.buffer
+        """
+        self.buf = _load(sys.stdin.buffer) if data is None else data
+        self.pos = 0
+        self.size = len(self.buf)
+
+    # ------------------------------------------------------------------
+    # tokens
+    # ------------------------------------------------------------------
+    def token(self):
+        """Next whitespace-separated token as bytes, or None at EOF."""
+        m = _TOKEN.search(self.buf, self.pos)
+        if m is None:
+            self.pos = self.size
+            return None
+        self.pos = m.end()
+        return m.group()
+
+    def tokens(self):
+        """Iterate over all remaining tokens."""
+        while True:
+            tok = self.token()
+            if tok is None:
+                return
+            yield tok
+
+    def int(self):
+        """Next token parsed as int (int() accepts bytes directly)."""
+        return int(self.token())
+
+    def ints(self, n):
+        """Next n tokens as a list of ints."""
+        out = []
+        m = None
+        for m in islice(_TOKEN.finditer(self.buf, self.pos), n):
+            out.append(int(m.group()))
+        if m is not None:
+            self.pos = m.end()
+        return out
+
+    def int_array(self, n, typecode='q'):
+        """Next n tokens as a compact array.array of machine ints."""
+        return array(typecode, self.ints(n))
+
+    def iter_ints(self):
+        """Iterate over all remaining tokens as ints."""
+        for tok in self.tokens():
+            yield int(tok)
+
+    # ------------------------------------------------------------------
+    # lines
+    # ------------------------------------------------------------------
+    def line(self):
+        """
+        Rest of the current line without the trailing newline (and a \\r
+        before it), or None at EOF.  Like readline(), but returns bytes.
+        """
+        if self.pos >= self.size:
+            return None
+        end = self.buf.find(b'\n', self.pos)
+        if end == -1:
+            end = self.size
+        start = self.pos
+        self.pos = end + 1
+        if end > start and self.buf[end - 1] == 13:  # '\r'
+            end -= 1
+        return self.buf[start:end]
+
+    def lines(self):
+        """Iterate over all remaining lines."""
+        while True:
+            ln = self.line()
+            if ln is None:
+                return
+            yield ln
+
+    def eof(self):
+        """True when only whitespace is left."""
+        return _TOKEN.search(self.buf, self.pos) is None
+
+
+class Writer:
+    """Buffered bytes sink for stdout, flushed in large batches."""
+
+    def __init__(self, stream=None, limit=1 << 16):
+        """
+        Args:
+            stream: binary stream to write to; defaults to sys.stdout.buffer
+            limit: flush once the buffer holds at least this many bytes
+        """
+        self.stream = sys.stdout.buffer if stream is None else stream
+        self.limit = limit
+        self.buf = bytearray()
+        atexit.register(self.flush)
+
+    def write(self, data):
+        """Append raw bytes (str is encoded) with no separator."""
+        if isinstance(data, str):
+            data = data.encode()
+        self.buf += data
+        if len(self.buf) >= self.limit:
+            self.flush()
+
+    def line(self, data=b''):
+        """Append data followed by a newline."""
+        if isinstance(data, str):
+            data = data.encode()
+        self.buf += data
+        self.buf += b'\n'
+        if len(self.buf) >= self.limit:
+            self.flush()
+
+    def int(self, x):
+        """Append one integer on its own line (b'%d' formatting, no str temporaries)."""
+        self.buf += b'%d\n' % x
+        if len(self.buf) >= self.limit:
+            self.flush()
+
+    def ints(self, xs, sep=b' '):
+        """Append a sequence of integers joined by sep, then a newline."""
+        self.buf += sep.join([b'%d' % x for x in xs])
+        self.buf += b'\n'
+        if len(self.buf) >= self.limit:
+            self.flush()
+
+    def flush(self):
+        """Hand everything buffered so far to the underlying stream."""
+        if self.buf:
+            self.stream.write(self.buf)
+            self.buf.clear()
+        self.stream.flush()
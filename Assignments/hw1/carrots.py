@@ -1,4 +1,9 @@
-N,P = list(map(int, input().split()))
-for _ in range(N):
-    input()
-print(P)
\ No newline at end of file
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastio import Reader, Writer
+
+r = Reader()
+out = Writer()
+N, P = r.int(), r.int()
+out.int(P)
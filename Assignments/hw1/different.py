@@ -1,6 +1,10 @@
+import os
 import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastio import Reader, Writer
 
-for line in sys.stdin.readlines():
-    x, y = list(map(int, line.split()))
-    print(abs(x-y))
-
+nums = Reader().iter_ints()
+out = Writer()
+for x in nums:
+    y = next(nums)
+    out.int(abs(x-y))
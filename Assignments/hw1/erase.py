@@ -1,22 +1,24 @@
+import os
 import sys
-N = int(input())
-Line1 = input().strip()
-Line2 = input().strip() 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastio import Reader, Writer
+
+r = Reader()
+out = Writer()
+N = int(r.line())
+Line1 = r.line().strip()
+Line2 = r.line().strip()
 
 if N % 2 != 0:
-    str = ''
-    for char in Line1:
-        if char == "1":
-            str += '0'
-        else:
-            str += '1'
-    
-    if str == Line2:
-        print("Deletion succeeded") 
+    # odd number of passes: every bit ends up flipped
+    flipped = Line1.translate(bytes.maketrans(b'01', b'10'))
+
+    if flipped == Line2:
+        out.line(b"Deletion succeeded")
     else:
-        print("Deletion failed")    
+        out.line(b"Deletion failed")
 else:
     if Line1 == Line2:
-        print("Deletion succeeded")         
+        out.line(b"Deletion succeeded")
     else:
-        print("Deletion failed")
\ No newline at end of file
+        out.line(b"Deletion failed")
@@ -1,3 +1,5 @@
+# Lecture notes on fast I/O.  The reusable version used by the solvers lives in ../fastio.py
+
 import sys; input = sys.stdin.readline
 
 N = int(input()); print(N)
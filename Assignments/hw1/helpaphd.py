@@ -1,7 +1,14 @@
-N=int(input())
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastio import Reader, Writer
+
+r = Reader()
+out = Writer()
+N = int(r.line())
 for i in range(N):
-    task = input()
-    if task == 'P=NP':
-        print('skipped')
+    task = r.line().strip()
+    if task == b'P=NP':
+        out.line(b'skipped')
     else:
-        print(eval(task))
\ No newline at end of file
+        out.int(eval(task))  # eval() accepts bytes source directly
@@ -1,29 +1,37 @@
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastio import Reader, Writer
+
+r = Reader()
+out = Writer()
 while True:
-    x, y = map(int, input().split())
+    x, y = r.int(), r.int()
     if x == 0 and y == 0:
         break
     if x + y == 13:
-        print("Never speak again.")
+        out.line(b"Never speak again.")
     elif x > y:
-        print("To the convention.")
+        out.line(b"To the convention.")
     elif x < y:
-        print("Left beehind.")
+        out.line(b"Left beehind.")
     else:
-        print("Undecided.")
+        out.line(b"Undecided.")
 
 
-# the code from the lecture 
+# the code from the lecture (kept for reference, not run: the loop above
+# has already consumed stdin)
 
-import sys 
-for line in sys.stdin.readlines():
-    x, y = list(map(int, line.split()))
-    if x == 0 and y == 0:
-        break
-    if x + y == 13:
-        print("Never speak again.")
-    elif x > y:
-        print("To the convention.")
-    elif x < y:
-        print("Left beehind.")
-    else:
-        print("Undecided.")
\ No newline at end of file
+# import sys 
+# for line in sys.stdin.readlines():
+#     x, y = list(map(int, line.split()))
+#     if x == 0 and y == 0:
+#         break
+#     if x + y == 13:
+#         print("Never speak again.")
+#     elif x > y:
+#         print("To the convention.")
+#     elif x < y:
+#         print("Left beehind.")
+#     else:
+#         print("Undecided.")
@@ -1,20 +1,25 @@
 # permutation_encryption.py
+import os
 import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastio import Reader, Writer
 
 def encrypt_blockwise(key, msg):
     n = len(key)
     # pad with spaces
     if len(msg) % n != 0:
-        msg += ' ' * (n - (len(msg) % n))
-    out_chars = []
+        msg += b' ' * (n - (len(msg) % n))
+    out_chars = bytearray()
     for i in range(0, len(msg), n):
         block = msg[i:i+n]
         for k in key:
             out_chars.append(block[k-1])
-    return ''.join(out_chars)
+    return out_chars
 
 def main():
-    for line in sys.stdin:
+    r = Reader()
+    out = Writer()
+    for line in r.lines():
         line = line.strip()
         if not line:
             continue
@@ -24,9 +29,9 @@ def main():
             break
         key = list(map(int, parts[1:1+n]))
         # read the message line (keep trailing spaces — remove only newline)
-        msg = sys.stdin.readline().rstrip('\n')
+        msg = r.line() or b''
         encrypted = encrypt_blockwise(key, msg)
-        print(f"'{encrypted}'")
+        out.line(b"'" + encrypted + b"'")
 
 if __name__ == "__main__":
     main()
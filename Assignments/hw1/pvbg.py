@@ -1,3 +1,7 @@
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastio import Reader, Writer
 
 # rows = int(input())
 # nums = list(map(int, input().split()))
@@ -10,9 +14,8 @@
 # print(sn+1)
     
 
-rows = int(input())
-nums = list(map(int, input().split()))
-print(min(nums) + 1)
-
-
-    
+r = Reader()
+out = Writer()
+rows = r.int()
+nums = r.ints(rows)
+out.int(min(nums) + 1)
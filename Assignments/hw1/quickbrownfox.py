@@ -1,14 +1,19 @@
-import string
-num_lines = int(input())
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastio import Reader, Writer
+
+LETTERS = b'abcdefghijklmnopqrstuvwxyz'
+
+r = Reader()
+out = Writer()
+num_lines = int(r.line())
 
 for _ in range(num_lines):
-    phrase = input()
-    phrase_lower = phrase.lower()
-    missing_letters = ''
-    for char in string.ascii_lowercase:
-        if char not in phrase_lower and char not in ['.', ',', '?', '!', '\'', '\"']:
-            missing_letters += char
-    if missing_letters == '':
-        print("pangram")
+    phrase = r.line()
+    present = set(phrase.lower())   # byte values, no str decoding needed
+    missing_letters = bytes(c for c in LETTERS if c not in present)
+    if not missing_letters:
+        out.line(b"pangram")
     else:
-        print("missing " + ''.join(sorted(missing_letters))) #no need to sort since we are iterating in alphabetical order
\ No newline at end of file
+        out.line(b"missing " + missing_letters) #no need to sort since we are iterating in alphabetical order
@@ -1,9 +1,14 @@
+import os
 import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastio import Reader, Writer
 
 # Allow arbitrarily large integers from input
 sys.set_int_max_str_digits(0)
 
-a = int(input().strip())
-b = int(input().strip())
+r = Reader()
+out = Writer()
+a = r.int()
+b = r.int()
 
-print(a + b)
+out.int(a + b)
@@ -1,15 +1,18 @@
+import os
 import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastio import Reader, Writer
 
 # I need to write a program that takes ascii numbers and outputs 
 # BEER!! if the number is divisible by 6 and BOOM!! otherwise
 
 # Canonical 3x5 patterns for digits 0..9 taken from the problem statement.
 DIGIT_ROWS = [
-    "***   * *** *** * * *** *** *** *** ***",
-    "* *   *   *   * * * *   *     * * * * *",
-    "* *   * *** *** *** *** ***   * *** ***",
-    "* *   * *     *   *   * * *   * * *   *",
-    "***   * *** ***   * *** ***   * *** ***"
+    b"***   * *** *** * * *** *** *** *** ***",
+    b"* *   *   *   * * * *   *     * * * * *",
+    b"* *   * *** *** *** *** ***   * *** ***",
+    b"* *   * *     *   *   * * *   * * *   *",
+    b"***   * *** ***   * *** ***   * *** ***"
 ]
 
 # Build mapping pattern -> digit
@@ -21,37 +24,36 @@ for d in range(10):
 
 def process_block(block_lines):
     """
-    block_lines: list of 5 strings (each includes spaces and '*' exactly as in input)
-    returns "BEER!!" or "BOOM!!"
+    block_lines: list of 5 byte strings (each includes spaces and '*' exactly as in input)
+    returns b"BEER!!" or b"BOOM!!"
     """
     # Determine number of digits from width: width = 4*n - 1  =>  n = (width + 1) // 4
     width = len(block_lines[0])
     if any(len(r) != width for r in block_lines):
         # Malformed input (unequal widths) -> invalid
-        return "BOOM!!"
+        return b"BOOM!!"
     if (width + 1) % 4 != 0:
-        return "BOOM!!"
+        return b"BOOM!!"
     n = (width + 1) // 4
     digits = []
     for j in range(n):
         start = j * 4
         pattern = tuple(line[start:start+3] for line in block_lines)
         if pattern not in digit_map:
-            return "BOOM!!"
+            return b"BOOM!!"
         digits.append(digit_map[pattern])
 
     # Check divisible by 6: divisible by 2 (even) and by 3 (sum of digits % 3 == 0)
     if digits[-1] % 2 != 0:
-        return "BOOM!!"
+        return b"BOOM!!"
     if sum(digits) % 3 != 0:
-        return "BOOM!!"
+        return b"BOOM!!"
     # numeric value is positive by problem statement if representation valid
-    return "BEER!!"
+    return b"BEER!!"
 
 def main():
-    raw_lines = sys.stdin.read().splitlines()
     # Remove completely empty lines (they are not part of blocks); keep lines that may contain spaces
-    lines = [ln for ln in raw_lines if ln != ""]
+    lines = [ln for ln in Reader().lines() if ln != b""]
     if not lines:
         return
 
@@ -63,9 +65,11 @@ def main():
         i += 5
     # If there are leftover lines not forming a full 5-line block, treat as invalid
     if i < len(lines):
-        outputs.append("BOOM!!")
+        outputs.append(b"BOOM!!")
 
-    print("\n".join(outputs))
+    out = Writer()
+    for verdict in outputs:
+        out.line(verdict)
 
 if __name__ == "__main__":
     main()
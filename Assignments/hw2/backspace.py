@@ -1,11 +1,16 @@
-s = input().strip()  # read the input string
-result = []
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastio import Reader, Writer
+
+s = Reader().token() or b''  # read the input string
+result = bytearray()
 
 for ch in s:
-    if ch == '<':
+    if ch == 60:        # '<'
         if result:      # only remove if there is something to remove
             result.pop()
     else:
         result.append(ch)
 
-print(''.join(result))
+Writer().line(result)
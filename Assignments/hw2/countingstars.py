@@ -1,33 +1,165 @@
+import os
 import sys
-sys.setrecursionlimit(10000)
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from array import array
+from fastio import Reader, Writer
 
-def dfs(grid, r, c, R, C):
-    if r < 0 or r >= R or c < 0 or c >= C or grid[r][c] != '-':
-        return
-    grid[r][c] = '#'  # mark visited
-    dfs(grid, r+1, c, R, C)
-    dfs(grid, r-1, c, R, C)
-    dfs(grid, r, c+1, R, C)
-    dfs(grid, r, c-1, R, C)
+try:
+    import numpy as np
+except ImportError:  # numpy mode is optional
+    np = None
 
-lines = [line.strip() for line in sys.stdin if line.strip() != '']
-i = 0
-case = 1
+# A star is a 4-connected group of '-' pixels.  The grid is kept as one flat
+# bytearray (cell (r, c) lives at r * cols + c), so neighbours are just
+# index +-1 and +-cols and there is no recursion anywhere: a 100x100 grid
+# of '-' used to blow through the recursion limit with the old dfs.
+SKY = ord('-')
+SEEN = ord('#')
 
-while i < len(lines):
-    # first number = rows, second = columns
-    rows, cols = map(int, lines[i].split())
-    i += 1
 
-    grid = [list(lines[i + r]) for r in range(rows)]
-    i += rows
+def count_stack(grid, rows, cols):
+    """Flood fill with an explicit stack.  Marks visited cells in grid."""
+    n = rows * cols
+    stars = 0
+    start = grid.find(b'-')
+    while start != -1:
+        stars += 1
+        grid[start] = SEEN
+        stack = [start]
+        while stack:
+            p = stack.pop()
+            c = p % cols
+            if p >= cols and grid[p - cols] == SKY:
+                grid[p - cols] = SEEN
+                stack.append(p - cols)
+            if p + cols < n and grid[p + cols] == SKY:
+                grid[p + cols] = SEEN
+                stack.append(p + cols)
+            if c > 0 and grid[p - 1] == SKY:
+                grid[p - 1] = SEEN
+                stack.append(p - 1)
+            if c + 1 < cols and grid[p + 1] == SKY:
+                grid[p + 1] = SEEN
+                stack.append(p + 1)
+        start = grid.find(b'-', start + 1)
+    return stars
+
+
+def count_union_find(grid, rows, cols):
+    """Union-find over cells: every sky cell joins its left and upper neighbour."""
+    parent = array('i', range(rows * cols))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # path halving
+            x = parent[x]
+        return x
 
     stars = 0
     for r in range(rows):
-        for c in range(cols):
-            if grid[r][c] == '-':
-                stars += 1
-                dfs(grid, r, c, rows, cols)
+        base = r * cols
+        for p in range(base, base + cols):
+            if grid[p] != SKY:
+                continue
+            stars += 1
+            if p > base and grid[p - 1] == SKY:
+                a, b = find(p), find(p - 1)
+                if a != b:
+                    parent[a] = b
+                    stars -= 1
+            if p >= cols and grid[p - cols] == SKY:
+                a, b = find(p), find(p - cols)
+                if a != b:
+                    parent[a] = b
+                    stars -= 1
+    return stars
+
+
+def count_numpy(grid, rows, cols):
+    """
+    Scanline labelling: label horizontal runs of sky with NumPy, then join
+    runs that touch vertically.  Only the (few) distinct run pairs go
+    through a Python-level union-find.
+    """
+    if np is None:
+        raise RuntimeError("numpy mode needs numpy installed")
+    sky = np.frombuffer(bytes(grid), dtype=np.uint8).reshape(rows, cols) == SKY
+
+    starts = sky.copy()
+    starts[:, 1:] &= ~sky[:, :-1]
+    runs = int(starts.sum())
+    if runs == 0:
+        return 0
+    run_id = np.cumsum(starts.ravel()).reshape(rows, cols) - 1
+
+    both = sky[:-1] & sky[1:]
+    pairs = np.unique(run_id[:-1][both] * runs + run_id[1:][both])
+
+    parent = list(range(runs))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    stars = runs
+    for key in pairs.tolist():
+        a, b = find(key // runs), find(key % runs)
+        if a != b:
+            parent[a] = b
+            stars -= 1
+    return stars
+
+
+MODES = {
+    'stack': count_stack,
+    'uf': count_union_find,
+    'numpy': count_numpy,
+}
+
+
+def bench(size=300):
+    """Compare the modes on dense and sparse random grids."""
+    import random
+    rng = random.Random(0)
+    modes = [m for m in MODES if m != 'numpy' or np is not None]
+    print(f"{size}x{size} grids, time per mode")
+    for label, density in (('all sky', 1.0), ('dense', 0.8), ('half', 0.5), ('sparse', 0.2)):
+        base = bytearray(SKY if rng.random() < density else SEEN for _ in range(size * size))
+        counts = {}
+        line = f"  {label:8s}"
+        for mode in modes:
+            grid = bytearray(base)
+            start = time.perf_counter()
+            counts[mode] = MODES[mode](grid, size, size)
+            line += f"  {mode}={time.perf_counter() - start:.3f}s"
+        assert len(set(counts.values())) == 1, counts
+        print(line + f"  ({counts[modes[0]]} stars)")
+
+
+def main(mode='stack'):
+    count = MODES[mode]
+    r_in = Reader()
+    out = Writer()
+    case = 1
+
+    while not r_in.eof():
+        # first number = rows, second = columns
+        rows, cols = r_in.int(), r_in.int()
+
+        # grid rows contain no spaces, so each one is a single token
+        grid = bytearray(b''.join(r_in.token() for _ in range(rows)))
+
+        stars = count(grid, rows, cols)
+        out.write(b"Case %d: %d\n" % (case, stars))
+        case += 1
+
 
-    print(f"Case {case}: {stars}")
-    case += 1
+if __name__ == "__main__":
+    # python countingstars.py [stack|uf|numpy]   or   python countingstars.py --bench
+    if len(sys.argv) > 1 and sys.argv[1] == '--bench':
+        bench()
+    else:
+        main(sys.argv[1] if len(sys.argv) > 1 else 'stack')
@@ -1,47 +1,63 @@
+import os
 import sys
-from collections import Counter, defaultdict
-
-def file_hash(s: str) -> int:
-    h = 0
-    for ch in s:
-        h ^= ord(ch)
-    return h
-
-def c2(x: int) -> int:
-    return x * (x - 1) // 2
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from array import array
+from fastio import Writer
+
+def file_hash(s: bytes) -> int:
+    """
+    XOR of all bytes, folded with big-int shifts instead of a per-byte loop.
+
+    Read the file as one little-endian integer; XOR-ing it with itself
+    shifted right by half its width (in bytes) combines byte i with byte
+    i + half.  Halving down to a single byte leaves the XOR of everything in
+    the low 8 bits.  Bits above the current half are garbage, but they are
+    never shifted down into the low byte, so no masking is needed until the end.
+    """
+    x = int.from_bytes(s, 'little')
+    k = 8 << max(len(s) - 1, 0).bit_length()
+    while k > 8:
+        k >>= 1
+        x ^= x >> k
+    return x & 0xFF
+
+def process_case(lines, n):
+    """
+    Single pass over the n file lines of one case.
+
+    Keeps only per-distinct-file counts plus one counter per hash value, so
+    memory scales with the number of distinct files.  Each new file adds
+    one collision for every earlier file with the same hash but a different
+    name: bucket[h] - seen[s].
+
+    Returns:
+        (number of distinct files, number of colliding pairs)
+    """
+    seen = {}                  # file -> [hash, count]
+    bucket = array('q', bytes(8 * 256))  # hash -> files so far with that hash
+    collisions = 0
+    for _ in range(n):
+        # remove only newline/CR — preserve all spaces and periods
+        s = next(lines).rstrip(b'\r\n')
+        entry = seen.get(s)
+        if entry is None:
+            entry = seen[s] = [file_hash(s), 0]
+        h = entry[0]
+        collisions += bucket[h] - entry[1]
+        bucket[h] += 1
+        entry[1] += 1
+    return len(seen), collisions
 
 def main():
-    inp = sys.stdin
-    while True:
-        header = inp.readline()
-        if not header:
+    lines = iter(sys.stdin.buffer)   # streamed line by line, never held whole
+    out = Writer()
+    for header in lines:
+        if not header.strip():
             break
-        n = int(header.strip())
+        n = int(header)
         if n == 0:
             break
-
-        files = []
-        for _ in range(n):
-            # remove only newline/CR — preserve all spaces and periods
-            s = inp.readline().rstrip('\r\n')
-            files.append(s)
-
-        unique_count = len(set(files))
-
-        # buckets: hash -> Counter(mapping file_string -> count)
-        buckets = defaultdict(Counter)
-        for s in files:
-            buckets[file_hash(s)][s] += 1
-
-        collisions = 0
-        for counter in buckets.values():
-            k = sum(counter.values())          # total files with this hash
-            collisions += c2(k)                # all same-hash pairs
-            # subtract pairs that are identical files (should not be collisions)
-            for m in counter.values():
-                collisions -= c2(m)
-
-        print(unique_count, collisions)
+        out.ints(process_case(lines, n))
 
 if __name__ == "__main__":
     main()
@@ -1,52 +1,70 @@
-# Read input
+import os
 import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastio import Writer, read_chunks
 
-data = sys.stdin.read().strip().split()
-if not data:
-    sys.exit(0)
-X = int(data[0])
-s = list(data[1].strip()) if len(data) > 1 else []
-
-diff = 0   # diff = #W - #M
-count = 0
-
-while s:
-    # Try first person
-    first = s[0]
-    can_first = False
-    if first == 'W':
-        can_first = abs(diff + 1) <= X
-    else:  # 'M'
-        can_first = abs(diff - 1) <= X
-
-    if can_first:
-        if first == 'W':
-            diff += 1
-        else:
-            diff -= 1
-        s.pop(0)
-        count += 1
-        continue
-
-    # Try second person if available
-    if len(s) >= 2:
-        second = s[1]
-        can_second = False
-        if second == 'W':
-            can_second = abs(diff + 1) <= X
-        else:
-            can_second = abs(diff - 1) <= X
-
-        if can_second:
-            if second == 'W':
-                diff += 1
+W = ord('W')
+M = ord('M')
+
+
+def count_admitted(X, chunks):
+    """
+    Count how many people get in, scanning the queue once.
+
+    The doorman may let in the person at the front or the one right behind
+    them.  So at most one person is ever "held" at the front (someone who
+    could not go in yet); every new byte from the stream is the second in
+    line.  No list is built and nothing is popped, so this is O(n) time and
+    O(1) extra memory, and it stops reading as soon as nobody can enter.
+
+    Args:
+        X: maximum allowed |#W - #M| inside the club
+        chunks: iterable of byte strings with the queue ('W'/'M', other
+                bytes such as newlines are ignored)
+    """
+    diff = 0      # diff = #W - #M
+    count = 0
+    held = 0      # byte value of the person stuck at the front, 0 = nobody
+
+    for chunk in chunks:
+        for person in chunk:
+            if person == W:
+                step = 1
+            elif person == M:
+                step = -1
             else:
-                diff -= 1
-            s.pop(1)
-            count += 1
-            continue
+                continue
+
+            if -X <= diff + step <= X:
+                # admit the front person, or the second one if someone is held
+                diff += step
+                count += 1
+                if held:
+                    # the held person is at the front again: try them now
+                    held_step = 1 if held == W else -1
+                    if -X <= diff + held_step <= X:
+                        diff += held_step
+                        count += 1
+                        held = 0
+                continue
+
+            if held:
+                # Neither first nor second can be admitted without exceeding X
+                return count
+            held = person
+
+    return count
+
 
-    # Neither first nor second can be admitted without exceeding X
-    break
+if __name__ == "__main__":
+    # Read input: X on the first line, then the (possibly huge) queue
+    stdin = sys.stdin.buffer
+    header = stdin.readline().split()
+    if not header:
+        sys.exit(0)
+    X = int(header[0])
+    # the queue normally follows on its own line; accept it on the same line too
+    chunks = header[1:] if len(header) > 1 else read_chunks(stdin)
 
-print(count)
+    out = Writer()
+    out.int(count_admitted(X, chunks))
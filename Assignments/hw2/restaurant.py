@@ -1,45 +1,47 @@
+import os
 import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastio import Reader, Writer
 
 def solve():
-    inp = sys.stdin
+    inp = Reader()
+    out = Writer()
     case_num = 0
     while True:
-        line = inp.readline()
-        if not line:
+        tok = inp.token()
+        if tok is None:
             break
-        n = int(line.strip())
+        n = int(tok)
         if n == 0:
             break
         case_num += 1
         pile1 = 0  # number of plates in pile 1
         pile2 = 0  # number of plates in pile 2
 
-        outputs = []
         for _ in range(n):
-            cmd, m_str = inp.readline().split()
-            m = int(m_str)
+            cmd = inp.token()
+            m = inp.int()
 
-            if cmd == "DROP":
+            if cmd == b"DROP":
                 # always drop into pile 2
                 pile2 += m
-                outputs.append(f"DROP 2 {m}")
+                out.write(b"DROP 2 %d\n" % m)
 
-            elif cmd == "TAKE":
+            elif cmd == b"TAKE":
                 to_take = m
                 # take from pile1 first
                 while to_take > 0:
                     if pile1 == 0:
                         # refill pile1 from pile2
-                        outputs.append(f"MOVE 2->1 {pile2}")
+                        out.write(b"MOVE 2->1 %d\n" % pile2)
                         pile1 += pile2
                         pile2 = 0
                     take_now = min(to_take, pile1)
-                    outputs.append(f"TAKE 1 {take_now}")
+                    out.write(b"TAKE 1 %d\n" % take_now)
                     pile1 -= take_now
                     to_take -= take_now
 
-        print("\n".join(outputs))
-        print()  # blank line between cases
+        out.line()  # blank line between cases
 
 if __name__ == "__main__":
     solve()
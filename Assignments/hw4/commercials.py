@@ -1,6 +1,12 @@
-
-n, p = map(int, input().split())
-students  = list(map(int, input().split()))
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastio import Reader, Writer
+
+r = Reader()
+out = Writer()
+n, p = r.int(), r.int()
+students  = r.ints(n)
     
 
 max_sum = 0
@@ -10,7 +16,7 @@ for i in range(n):
     current_sum = max(0, current_sum + students[i] - p)
     max_sum = max(max_sum, current_sum)
 
-print(max_sum)
+out.int(max_sum)
 
 # 
 # Our favorite Onid Pizza would like to have a commercial aired in a radio. Since they are 
@@ -34,56 +34,86 @@ Can't close diagonally adjacent rooms (room[i][0] and room[i+1][1], or room[i][1
 This is a 2D DP problem similar to knapsack but with adjacency constraints.
 
 """
+import os
+import sys
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastio import Reader, Writer
 
-def solve(row, k, last_closed, memo):
+
+INF = float('inf')
+
+
+def min_closed_value(values, k):
     """
-    Top-down DP with memoization.
-    
+    Bottom-up DP over rows with two rolling arrays.
+
+    cur[j * 3 + last] = minimum value of the j rooms closed so far, where
+    last says what was closed in the previous row:
+        0 = nothing, 1 = left, 2 = right
+    Only the previous row is ever needed, so memory is O(k) instead of a
+    dict entry per (row, k, last_closed).
+
     Args:
-        row: current row index (0 to N-1)
-        k: number of rooms still need to close
-        last_closed: what was closed in previous row
-                     0 = nothing, 1 = left, 2 = right
-        memo: memoization dictionary
-    
+        values: list of (left, right) room values, one per row
+        k: number of rooms that must be closed
+
     Returns:
-        minimum value of k rooms we close
+        minimum total value of exactly k closed rooms (INF if impossible)
     """
-    # Base case: processed all rows
-    if row == N:
-        if k == 0:
-            return 0  # Successfully closed exactly k rooms
-    
-    # Check memo
-    if (row, k, last_closed) in memo:
-        return memo[(row, k, last_closed)]
-    
-    # Try all valid options for current row
-    options = []
-    
-    # Option 1: Close nothing in this row
-    if k >= 0:  # Can skip if we still have rooms to close later
-        options.append(solve(row + 1, k, 0, memo))
-    
-    # Option 2: Close left room
-    # Can't close if last row closed right (diagonal)
-    if last_closed != 2:
-        options.append(values[row][0] + solve(row + 1, k - 1, 1, memo))
-    
-    # Option 3: Close right room
-    # Can't close if last row closed left (diagonal)
-    if last_closed != 1:
-        options.append(values[row][1] + solve(row + 1, k - 1, 2, memo))
-    
-    # Can't close both rooms in same row (violates constraint)
-    
-    result = min(options)
-    memo[(row, k, last_closed)] = result
-    return result
-
-
-# Main
-total_value = sum(sum(row) for row in values)
-min_closed_value = solve(0, k, 0, {})
-max_open_value = total_value - min_closed_value
-print(max_open_value)
\ No newline at end of file
+    width = 3 * (k + 1)
+    cur = [INF] * width
+    cur[0] = 0  # before row 0: nothing closed, previous row "closed nothing"
+    nxt = [INF] * width
+
+    for left, right in values:
+        # Option 1: close nothing in this row
+        for j in range(k + 1):
+            base = 3 * j
+            nxt[base] = min(cur[base], cur[base + 1], cur[base + 2])
+        nxt[1] = nxt[2] = INF
+        for j in range(1, k + 1):
+            base = 3 * j
+            prev = base - 3
+            # Option 2: close left -- not allowed if last row closed right (diagonal)
+            nxt[base + 1] = left + min(cur[prev], cur[prev + 1])
+            # Option 3: close right -- not allowed if last row closed left (diagonal)
+            nxt[base + 2] = right + min(cur[prev], cur[prev + 2])
+        # Can't close both rooms in same row (violates constraint)
+        cur, nxt = nxt, cur
+
+    return min(cur[3 * k], cur[3 * k + 1], cur[3 * k + 2])
+
+
+def bench(n=200, cases=20):
+    """Time the DP on random galleries at N = n, k = n."""
+    import random
+    rng = random.Random(0)
+    galleries = [[(rng.randint(0, 100), rng.randint(0, 100)) for _ in range(n)]
+                 for _ in range(cases)]
+    start = time.perf_counter()
+    for values in galleries:
+        min_closed_value(values, n)
+    elapsed = time.perf_counter() - start
+    print(f"N={n}, k={n}: {elapsed / cases * 1000:.2f} ms per case ({cases} cases)")
+
+
+def main():
+    r = Reader()
+    out = Writer()
+    while not r.eof():
+        N, k = r.int(), r.int()
+        if N == 0 and k == 0:
+            break
+        rooms = r.ints(2 * N)
+        values = list(zip(rooms[0::2], rooms[1::2]))
+
+        total_value = sum(rooms)
+        out.int(total_value - min_closed_value(values, k))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--bench':
+        bench()
+    else:
+        main()
@@ -1,45 +1,143 @@
+import os
 import sys
-sys.setrecursionlimit(10000)
-from functools import lru_cache
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastio import Reader, Writer
+
+try:
+    import numpy as np
+except ImportError:  # numpy mode is optional
+    np = None
 
 INF = 10**15
 
+# State (pos, jump): standing on square pos, the last jump had length jump.
+#   forward:  pos -> pos + jump + 1, new jump = jump + 1
+#   backward: pos -> pos - jump,     same jump
+# cost(pos, jump) = minimum *additional* fees to reach N from that state.
+# Forward moves only go to jump + 1, and backward moves keep jump but lower
+# pos, so the states form a DAG: fill jump rows from the largest jump down,
+# and inside one row go by increasing pos.  Only rows jump and jump + 1 are
+# alive at any time -> O(N) memory, no recursion, no per-state hash entry.
+# (jump can grow up to N - 1 by bouncing forward and back, so there are
+# O(N^2) states and the work is O(N^2).)
+
+
+def min_cost_python(fees, N):
+    """
+    Row-by-row DP with two flat lists.
+
+    Args:
+        fees: fees[1..N] (fees[0] unused)
+        N: number of squares
+
+    Returns:
+        cost of getting from (2, 1) to N, not counting fees[2]
+    """
+    nxt = [INF] * (N + 1)   # row jump + 1
+    cur = [INF] * (N + 1)   # row jump
+    for jump in range(N - 1, 0, -1):
+        for pos in range(1, N + 1):
+            if pos == N:
+                cur[pos] = 0
+                continue
+            best = INF
+            # forward: length = jump + 1
+            fpos = pos + jump + 1
+            if fpos <= N:
+                best = fees[fpos] + nxt[fpos]
+            # backward: length = jump (row already filled for smaller pos)
+            bpos = pos - jump
+            if bpos >= 1:
+                back = fees[bpos] + cur[bpos]
+                if back < best:
+                    best = back
+            cur[pos] = best
+        cur, nxt = nxt, cur
+    return nxt[2]
+
+
+def min_cost_numpy(fees, N):
+    """
+    Same DP, but each jump row is computed with whole-array operations.
+
+    Inside row j the backward moves chain positions r, r + j, r + 2j, ...
+    With A = best forward option and F = fee of the previous square on the
+    chain, cost_m = min(A_m, F_m + cost_{m-1}).  Writing S for the running
+    sum of F turns that into cost = S + running_min(A - S), so laying the
+    row out as a (chains x j) matrix gives cumsum + minimum.accumulate
+    down axis 0.
+    """
+    if np is None:
+        raise RuntimeError("numpy mode needs numpy installed")
+    fee = np.asarray(fees, dtype=np.int64)            # index = position
+    nxt = np.full(N + 1, INF, dtype=np.int64)
+    for jump in range(N - 1, 0, -1):
+        # forward option A for positions 1..N
+        A = np.full(N + 1, INF, dtype=np.int64)
+        reach = N - jump - 1                           # last pos with a forward move
+        if reach >= 1:
+            A[1:reach + 1] = fee[jump + 2:] + nxt[jump + 2:]
+        A[N] = 0
+
+        rows = -(-N // jump)
+        pad = rows * jump - N
+        A_mat = np.concatenate((A[1:], np.full(pad, INF, dtype=np.int64))).reshape(rows, jump)
+        f_mat = np.concatenate((fee[1:], np.zeros(pad, dtype=np.int64))).reshape(rows, jump)
+        F = np.zeros_like(f_mat)
+        F[1:] = f_mat[:-1]
+        S = np.cumsum(F, axis=0)
+        cost = S + np.minimum.accumulate(A_mat - S, axis=0)
+
+        nxt = np.empty(N + 1, dtype=np.int64)
+        nxt[0] = INF
+        nxt[1:] = cost.ravel()[:N]
+    return int(nxt[2])
+
+
+def min_cost(fees, N):
+    """Use the NumPy engine when available, plain lists otherwise."""
+    if np is not None:
+        return min_cost_numpy(fees, N)
+    return min_cost_python(fees, N)
+
+
+def bench(sizes=(1000, 3000, 10000)):
+    """Scaling benchmark: time both engines for growing N."""
+    import random
+    rng = random.Random(0)
+    for N in sizes:
+        fees = [0] + [rng.randint(1, 500) for _ in range(N)]
+        line = f"N={N:6d}"
+        results = set()
+        engines = [('numpy', min_cost_numpy)] if np is not None else []
+        if N <= 3000:  # pure Python is O(N^2) interpreted steps
+            engines.append(('python', min_cost_python))
+        for name, fn in engines:
+            start = time.perf_counter()
+            results.add(fn(fees, N))
+            line += f"  {name}={time.perf_counter() - start:.3f}s"
+        assert len(results) == 1, results
+        print(line)
+
+
 def solve():
-    data = sys.stdin.read().strip().split()
-    if not data:
+    r = Reader()
+    if r.eof():
         return
-    it = iter(map(int, data))
-    N = next(it)
-    fees = [0] + [next(it) for _ in range(N)]  # fees[1..N]
-
-    @lru_cache(None)
-    def dfs(pos, jump):
-        """
-        Minimum *additional* cost to reach N from (pos, jump),
-        assuming the entry fee for 'pos' has already been paid.
-        """
-        if pos == N:
-            return 0
-        best = INF
-
-        # forward: length = jump + 1
-        fpos = pos + (jump + 1)
-        if fpos <= N:
-            best = min(best, fees[fpos] + dfs(fpos, jump + 1))
-
-        # backward: length = jump (only if jump > 0)
-        bpos = pos - jump
-        if jump > 0 and bpos >= 1:
-            best = min(best, fees[bpos] + dfs(bpos, jump))
-
-        return best
+    out = Writer()
+    N = r.int()
+    fees = [0] + r.ints(N)  # fees[1..N]
 
     # Important: starting on square 1 does NOT count as "entering" it,
     # so we do NOT pay fees[1] initially.
     # The *first required* move is 1 -> 2 with jump length 1, so we pay fee[2],
     # then continue from state (2,1) assuming fee[2] already paid.
-    total_cost = fees[2] + dfs(2, 1)
-    print(total_cost)
+    total_cost = fees[2] + min_cost(fees, N)
+    out.int(total_cost)
 
 if __name__ == "__main__":
-    solve()
+    if len(sys.argv) > 1 and sys.argv[1] == '--bench':
+        bench()
+    else:
+        solve()
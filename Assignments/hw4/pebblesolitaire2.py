@@ -1,4 +1,3 @@
-
 """
 Pebble Solitaire - State Space Search with Memoization
 
@@ -6,6 +5,11 @@ Problem: Remove as many pebbles as possible by jumping over adjacent pebbles.
 Move: oo- becomes --o (or -oo becomes o--)
 Goal: Minimize remaining pebbles
 """
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastio import Reader, Writer
+
 def find_all_moves(board):
     """
     Find all valid moves in the current board state.
@@ -92,14 +96,140 @@ def solve(board, memo):
     return min_pebbles
 
 
+# ============================================================================
+# Bitmask version: the board as a 23-bit int, one shared table for all cases
+# ============================================================================
+#
+# Bit i is 1 when cell i holds a pebble.  Both kinds of move touch three
+# consecutive cells and simply flip all of them:
+#     oo- -> --o   and   -oo -> o--   are both   board ^ (0b111 << i)
+# so a move at i is legal when the 3-bit window at i is 011 or 110.
+# Every move removes exactly one pebble, which also gives a safe order for
+# filling a full table: by increasing number of pebbles.
 
+CELLS = 23
+WINDOWS = (1 << (CELLS - 2)) - 1    # legal window start positions 0..20
+UNKNOWN = 0xFF
+TABLE_SIZE = 1 << CELLS
 
-if __name__ == "__main__":
-    n = int(input())    
-    for _ in range(n):
-        board = input().strip()
-        print(solve(board, {}))
+# one transposition table shared by every query in the run (8 MiB)
+table = bytearray(b'\xff') * TABLE_SIZE
+
+_TO_BITS = bytes.maketrans(b'o-', b'10')
 
 
-   
+def encode(board):
+    """'o-' board text (str or bytes) -> 23-bit int, cell i at bit i."""
+    if isinstance(board, str):
+        board = board.encode()
+    return int(board[::-1].translate(_TO_BITS), 2)
 
+
+def move_mask(b):
+    """Bit i set <=> a jump over cells i..i+2 is legal (window 011 or 110)."""
+    mid = b >> 1
+    high = b >> 2
+    return ((b & mid & ~high) | (~b & mid & high)) & WINDOWS
+
+
+def solve_bits(board):
+    """
+    Minimum pebbles left from an encoded board.
+
+    Iterative post-order DFS (no recursion) that fills the shared table;
+    anything a previous test case already solved is an O(1) lookup.
+    """
+    if table[board] != UNKNOWN:
+        return table[board]
+    stack = [board]
+    while stack:
+        b = stack[-1]
+        if table[b] != UNKNOWN:
+            stack.pop()
+            continue
+        best = b.bit_count()
+        pending = False
+        moves = move_mask(b)
+        while moves:
+            low = moves & -moves
+            moves ^= low
+            v = table[b ^ (low * 7)]
+            if v == UNKNOWN:
+                stack.append(b ^ (low * 7))
+                pending = True
+            elif v < best:
+                best = v
+        if not pending:
+            table[b] = best
+            stack.pop()
+    return table[board]
+
+
+def precompute_all():
+    """
+    Fill the table for all 2^23 boards.  Uses NumPy when it is installed
+    (a few seconds); otherwise falls back to solving every board with
+    solve_bits (tens of seconds in pure Python).
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is None:
+        for b in range(TABLE_SIZE):
+            solve_bits(b)
+        return table
+
+    boards = np.arange(TABLE_SIZE, dtype=np.uint32)
+    # popcount of every board (SWAR bit tricks, works on any NumPy version)
+    pc = boards - ((boards >> 1) & 0x55555555)
+    pc = (pc & 0x33333333) + ((pc >> 2) & 0x33333333)
+    pc = (((pc + (pc >> 4)) & 0x0F0F0F0F) * 0x01010101) >> 24
+    ans = pc.astype(np.uint8)
+    order = np.argsort(pc, kind='stable').astype(np.uint32)
+    bounds = np.searchsorted(pc[order], np.arange(CELLS + 2))
+
+    # boards with k pebbles only depend on boards with k - 1 pebbles
+    for k in range(2, CELLS + 1):
+        level = order[bounds[k]:bounds[k + 1]]
+        for i in range(CELLS - 2):
+            window = (level >> i) & 7
+            sel = level[(window == 3) | (window == 6)]
+            ans[sel] = np.minimum(ans[sel], ans[sel ^ np.uint32(7 << i)])
+
+    table[:] = ans.tobytes()
+    return table
+
+
+def save_table(path):
+    """Write the (fully precomputed) table to disk: one byte per board."""
+    with open(path, 'wb') as fh:
+        fh.write(table)
+
+
+def load_table(path):
+    """Load a table written by save_table(); queries become O(1) lookups."""
+    with open(path, 'rb') as fh:
+        data = fh.read()
+    if len(data) != TABLE_SIZE:
+        raise ValueError(f"{path}: expected {TABLE_SIZE} bytes, got {len(data)}")
+    table[:] = data
+
+
+if __name__ == "__main__":
+    # python pebblesolitaire2.py                      normal run (stdin -> stdout)
+    # python pebblesolitaire2.py --precompute FILE    build and save the full table
+    # python pebblesolitaire2.py --table FILE         answer queries from a saved table
+    if len(sys.argv) == 3 and sys.argv[1] == '--precompute':
+        precompute_all()
+        save_table(sys.argv[2])
+        sys.exit(0)
+    if len(sys.argv) == 3 and sys.argv[1] == '--table':
+        load_table(sys.argv[2])
+
+    r = Reader()
+    out = Writer()
+    n = r.int()
+    for _ in range(n):
+        out.int(solve_bits(encode(r.token())))
@@ -1,19 +1,50 @@
 import itertools
+import os
 import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # the NumPy sweep is optional
+    np = None
+
+# ----------------------------------------------------------------------------
+# Digit-mask table
+# ----------------------------------------------------------------------------
+# DIGIT_MASK[x] describes x written with 5 digits (leading zeros included):
+# bit d is set when digit d occurs, and REPEATED is set instead when some
+# digit occurs twice.  A unique 5-digit string has exactly 5 bits, so two of
+# them use all ten digits exactly once iff the OR of their masks is FULL
+# (a REPEATED bit anywhere makes that impossible).
+
+FULL = (1 << 10) - 1
+REPEATED = 1 << 10
+LIMIT = 100000          # 5-digit numbers 00000..99999
+
+
+def build_digit_masks():
+    """Masks for 0..99999, built from the masks of 0..9999 (x // 10) plus one digit."""
+    masks = array('H', [1 << d for d in range(10)])   # 1-digit strings
+    for _ in range(4):
+        longer = array('H', bytes(2 * 10 * len(masks)))
+        for prefix, m in enumerate(masks):
+            base = prefix * 10
+            for d in range(10):
+                bit = 1 << d
+                longer[base + d] = REPEATED if m & (bit | REPEATED) else m | bit
+        masks = longer
+    return masks
+
+
+DIGIT_MASK = build_digit_masks()
+
 
 def has_all_unique_digits(num1, num2):
     """Check if two numbers together use all digits 0-9 exactly once."""
-    # Pad numbers to 5 digits each
-    s1 = str(num1).zfill(5)
-    s2 = str(num2).zfill(5)
-    combined = s1 + s2
-    
-    # Check if we have exactly 10 digits and all are unique
-    if len(combined) != 10:
+    # Both must fit in 5 digits (zero-padded); then it is two table lookups
+    if not (0 <= num1 < LIMIT and 0 <= num2 < LIMIT):
         return False
-    
-    # Check if all digits 0-9 are present
-    return sorted(combined) == ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9']
+    return DIGIT_MASK[num1] | DIGIT_MASK[num2] == FULL
 
 def solution1_naive():
     """
@@ -92,6 +123,79 @@ def solution2_optimized():
     
     return results
 
+def solutions_for(n):
+    """
+    All (dividend, divisor, n) with dividend / divisor = n and all ten
+    digits used once, for a single n -- no sweep over the other values.
+    """
+    masks = DIGIT_MASK
+    max_divisor = min(98765, 99999 // n)
+    return [(divisor * n, divisor, n)
+            for divisor in range(1234, max_divisor + 1)
+            if masks[divisor * n] | masks[divisor] == FULL]
+
+
+def _sweep_numpy(ns):
+    """Every n at once: a (len(ns) x divisors) broadcast of table lookups."""
+    masks = np.frombuffer(DIGIT_MASK, dtype=np.uint16)
+    divisors = np.arange(1234, 98766)
+    n_col = np.asarray(ns)[:, None]
+    dividends = n_col * divisors
+    fits = dividends < LIMIT
+    ok = fits & ((masks[np.where(fits, dividends, 0)] | masks[divisors]) == FULL)
+    rows, cols = np.nonzero(ok)
+    return [(int(dividends[r, c]), int(divisors[c]), int(ns[r])) for r, c in zip(rows, cols)]
+
+
+def sweep(ns=range(2, 80), method="auto", processes=None):
+    """
+    solutions_for over many n.
+
+    Args:
+        ns: values of N to solve for
+        method: "serial", "pool" (one n per task on a process pool), or
+                "numpy" (one broadcasted check).  With the table, serial
+                runs in ~0.05s, so the pool and NumPy only pay off for
+                wider sweeps; "auto" is serial.
+        processes: pool size for method="pool" (default: os.cpu_count())
+
+    Returns:
+        list of (dividend, divisor, n), ordered by n then divisor
+    """
+    ns = list(ns)
+    if method == "auto":
+        method = "serial"
+    if method == "numpy":
+        if np is None:
+            raise RuntimeError("numpy sweep needs numpy installed")
+        return _sweep_numpy(ns)
+    if method == "pool":
+        from multiprocessing import Pool
+        with Pool(processes or os.cpu_count() or 1) as pool:
+            parts = pool.map(solutions_for, ns)
+    elif method == "serial":
+        parts = map(solutions_for, ns)
+    else:
+        raise ValueError(f"unknown sweep method {method!r}")
+    return [r for part in parts for r in part]
+
+
+def solution3_table(method="auto"):
+    """
+    Solution 2's search, but each check is two lookups in the digit-mask
+    table, and the n values can be spread over processes or NumPy.
+    """
+    print("\n=== Solution 3: Digit-Mask Table ===")
+    start_time = time.time()
+    results = sweep(method=method)
+    elapsed = time.time() - start_time
+
+    print(f"Solutions found: {len(results)}")
+    print(f"Time: {elapsed:.3f} seconds")
+    print(f"Single query, N = 62: {[(a, b) for a, b, _ in solutions_for(62)]}")
+    return results
+
+
 def verify_solutions(results1, results2):
     """Verify both solutions found the same results."""
     print("\n=== Verification ===")
@@ -112,6 +216,10 @@ if __name__ == "__main__":
     # Run optimized solution first (faster)
     results2 = solution2_optimized()
     
+    # Table-driven sweep
+    results3 = solution3_table()
+    verify_solutions(results3, results2)
+    
     # Run naive solution (slower)
     print("\n" + "="*50)
     results1 = solution1_naive()
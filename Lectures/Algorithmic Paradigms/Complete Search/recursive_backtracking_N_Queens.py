@@ -1,3 +1,119 @@
+import os
+import sys
+import time
+from itertools import islice
+
+
+class SearchHook:
+    """
+    Base class for place_queens instrumentation.  Override any subset of
+    the events; the defaults do nothing.  Every event gets the solver, so a
+    hook can read solver.Q (Q[1..r-1] = queens placed so far).
+    """
+
+    def on_node(self, solver, r):
+        """PlaceQueens(Q, r) was entered (one search-tree node)."""
+
+    def on_solution(self, solver, r):
+        """r == n + 1: all queens placed."""
+
+    def on_try(self, solver, r, j):
+        """About to test column j for the queen of row r."""
+
+    def on_check(self, solver, r, j, i, conflict):
+        """Compared (r, j) against the queen in row i."""
+
+    def on_place(self, solver, r, j):
+        """(r, j) was legal; Q[r] = j and recursing."""
+
+    def on_backtrack(self, solver, r, j):
+        """Returned from row r + 1 after placing (r, j)."""
+
+
+class Counters(SearchHook):
+    """Fills solver.recursive_calls and solver.legality_checks."""
+
+    def on_node(self, solver, r):
+        solver.recursive_calls += 1
+
+    def on_check(self, solver, r, j, i, conflict):
+        solver.legality_checks += 1
+
+
+class PrintTrace(SearchHook):
+    """The lecture's step-by-step trace (what verbose=True prints)."""
+
+    def on_node(self, solver, r):
+        print(f"{'  ' * (r - 1)}PlaceQueens called with r={r}, Q={solver.Q[1:r]}")
+
+    def on_solution(self, solver, r):
+        print(f"{'  ' * (r-1)}✓ Solution found: {solver.Q[1:]}")
+
+    def on_try(self, solver, r, j):
+        print(f"{'  ' * (r-1)}Trying queen at row {r}, column {j}")
+
+    def on_check(self, solver, r, j, i, conflict):
+        if conflict:
+            print(f"{'  ' * (r-1)}  ✗ Conflicts with queen at row {i}, col {solver.Q[i]}")
+
+    def on_place(self, solver, r, j):
+        print(f"{'  ' * (r-1)}  ✓ Legal! Placing queen and recursing...")
+
+    def on_backtrack(self, solver, r, j):
+        print(f"{'  ' * (r-1)}  ← Backtracked from r={r+1}")
+
+
+class SampledTrace(SearchHook):
+    """Print only every `every`-th search node, for boards too big to trace fully."""
+
+    def __init__(self, every=1000, out=None):
+        self.every = every
+        self.out = out
+        self.nodes = 0
+
+    def on_node(self, solver, r):
+        self.nodes += 1
+        if self.nodes % self.every == 0:
+            print(f"node {self.nodes:,}: r={r}, Q={solver.Q[1:r]}", file=self.out or sys.stdout)
+
+
+class FlameStacks(SearchHook):
+    """
+    Collect samples in the folded-stack format that flamegraph.pl and
+    speedscope read: one line "frame;frame;... count" per distinct stack.
+
+    A stack is the chain of placements leading to a node
+    (place_queens;Q1=3;Q2=5;...), cut at max_depth so wide boards stay
+    readable.  Every search node and every legality check is one sample,
+    charged to the partial board it happened on.
+    """
+
+    def __init__(self, max_depth=None):
+        self.max_depth = max_depth
+        self.samples = {}
+
+    def _stack(self, solver, r):
+        depth = r - 1 if self.max_depth is None else min(r - 1, self.max_depth)
+        return ";".join(["place_queens"] + [f"Q{i}={solver.Q[i]}" for i in range(1, depth + 1)])
+
+    def on_node(self, solver, r):
+        key = self._stack(solver, r)
+        self.samples[key] = self.samples.get(key, 0) + 1
+
+    def on_check(self, solver, r, j, i, conflict):
+        key = self._stack(solver, r)
+        self.samples[key] = self.samples.get(key, 0) + 1
+
+    def dump(self, out=None):
+        """Write the folded stacks (to a path or an open file; default stdout)."""
+        if isinstance(out, (str, os.PathLike)):
+            with open(out, "w") as f:
+                return self.dump(f)
+        out = out or sys.stdout
+        for key in sorted(self.samples):
+            out.write(f"{key} {self.samples[key]}\n")
+
+
 class NQueensBacktracking:
     """
     N-Queens solver using recursive backtracking.
@@ -7,75 +123,108 @@ class NQueensBacktracking:
     - Q[1..n] array where Q[i] = column position of queen in row i
     - r = index of first empty row
     - Q[1..r-1] = positions of first r-1 queens already placed
+
+    Instrumentation is opt-in: pass hooks (SearchHook instances such as
+    Counters, PrintTrace, SampledTrace, FlameStacks).  Without hooks the
+    solver binds an uninstrumented search once, in __init__, so the hot
+    loop never tests for tracing.
     """
     
-    def __init__(self, n=8):
+    def __init__(self, n=8, hooks=()):
         self.n = n
         self.Q = [0] * (n + 1)  # 1-indexed array (Q[0] unused, Q[1..n] used)
         self.solutions = []
         self.recursive_calls = 0
         self.legality_checks = 0
-        
+        self.hooks = list(hooks)
+        if self.hooks:
+            self._search = lambda r: self._place_queens_hooked(r, self.hooks)
+        else:
+            self._search = self._place_queens_fast
+
     def place_queens(self, r, verbose=False):
         """
         PlaceQueens(Q[1..n], r) from lecture
         
         Args:
             r: index of first empty row (1-indexed)
-            verbose: if True, print each step
+            verbose: if True, print each step (adds a PrintTrace hook for this run)
         """
-        self.recursive_calls += 1
-        
         if verbose:
-            indent = "  " * (r - 1)
-            print(f"{indent}PlaceQueens called with r={r}, Q={self.Q[1:r]}")
+            self._place_queens_hooked(r, self.hooks + [PrintTrace()])
+        else:
+            self._search(r)
+
+    def _place_queens_fast(self, r):
+        """PlaceQueens with no instrumentation at all."""
+        n = self.n
+        Q = self.Q
+
+        # Base case: if r == n + 1, all queens placed successfully
+        if r == n + 1:
+            self.solutions.append(Q[1:n + 1])
+            return
+
+        for j in range(1, n + 1):
+            # legal iff no earlier queen shares the column or a diagonal
+            for i in range(1, r):
+                q = Q[i]
+                if q == j or q == j + r - i or q == j - r + i:
+                    break
+            else:
+                Q[r] = j
+                self._place_queens_fast(r + 1)
+
+    def _place_queens_hooked(self, r, hooks):
+        """PlaceQueens reporting every event to the given hooks."""
+        for hook in hooks:
+            hook.on_node(self, r)
         
         # Base case: if r == n + 1, all queens placed successfully
         if r == self.n + 1:
-            if verbose:
-                print(f"{'  ' * (r-1)}✓ Solution found: {self.Q[1:]}")
+            for hook in hooks:
+                hook.on_solution(self, r)
             self.solutions.append(self.Q[1:self.n + 1].copy())
             return
         
         # Recursive case: try all possible placements of queen on row r
         # For j ← 1 to n
         for j in range(1, self.n + 1):
-            if verbose:
-                print(f"{'  ' * (r-1)}Trying queen at row {r}, column {j}")
+            for hook in hooks:
+                hook.on_try(self, r, j)
             
             # Check if placement is legal
             legal = True
             
             # For i ← 1 to r-1: check against all previously placed queens
             for i in range(1, r):
-                self.legality_checks += 1
-                
                 # Check three conditions from lecture:
                 # 1. Q[i] = j → same column
                 # 2. Q[i] = j + r - i → diagonal /
                 # 3. Q[i] = j - r + i → diagonal \
-                if (self.Q[i] == j or 
-                    self.Q[i] == j + r - i or 
-                    self.Q[i] == j - r + i):
+                conflict = (self.Q[i] == j or
+                            self.Q[i] == j + r - i or
+                            self.Q[i] == j - r + i)
+                for hook in hooks:
+                    hook.on_check(self, r, j, i, conflict)
+                if conflict:
                     legal = False
-                    if verbose:
-                        print(f"{'  ' * (r-1)}  ✗ Conflicts with queen at row {i}, col {self.Q[i]}")
                     break
             
             # If legal, place queen and recurse
             if legal:
-                if verbose:
-                    print(f"{'  ' * (r-1)}  ✓ Legal! Placing queen and recursing...")
+                for hook in hooks:
+                    hook.on_place(self, r, j)
                 
                 # Q[r] ← j
                 self.Q[r] = j
                 
                 # PlaceQueens(Q[1..n], r + 1) - RECURSION!
-                self.place_queens(r + 1, verbose)
+                self._place_queens_hooked(r + 1, hooks)
                 
                 # Implicit backtracking: when recursion returns, we try next j
-                if verbose:
-                    print(f"{'  ' * (r-1)}  ← Backtracked from r={r+1}")
+                for hook in hooks:
+                    hook.on_backtrack(self, r, j)
     
     def solve(self, verbose=False):
         """Solve the N-Queens problem starting from row 1."""
@@ -88,24 +237,95 @@ class NQueensBacktracking:
         
         # Start with row 1 (first empty row)
         self.place_queens(1, verbose)
+        counted = any(isinstance(hook, Counters) for hook in self.hooks)
         
         print(f"\n{'='*70}")
         print(f"RESULTS")
         print(f"{'='*70}")
         print(f"✓ Solutions found: {len(self.solutions)}")
-        print(f"✓ Recursive calls: {self.recursive_calls:,}")
-        print(f"✓ Legality checks: {self.legality_checks:,}")
+        if counted:
+            print(f"✓ Recursive calls: {self.recursive_calls:,}")
+            print(f"✓ Legality checks: {self.legality_checks:,}")
+        else:
+            print("  (construct with hooks=[Counters()] to count calls and checks)")
         print(f"\n{'='*70}")
         print(f"SEARCH SPACE ANALYSIS")
         print(f"{'='*70}")
         print(f"Naive approach: C({self.n}²,{self.n}) = C({self.n**2},{self.n}) = {self.combinations(self.n**2, self.n):,}")
         print(f"One-per-row approach: {self.n}^{self.n} = {self.n**self.n:,}")
-        print(f"Actual recursive calls: {self.recursive_calls:,}")
-        reduction = (1 - self.recursive_calls / self.n**self.n) * 100
-        print(f"Reduction from pruning: {reduction:.2f}%")
+        if counted:
+            print(f"Actual recursive calls: {self.recursive_calls:,}")
+            reduction = (1 - self.recursive_calls / self.n**self.n) * 100
+            print(f"Reduction from pruning: {reduction:.2f}%")
         
         return self.solutions
     
+    def iter_solutions(self, limit=None):
+        """
+        Yield solutions one at a time (Q[1..n] as a list), without storing them.
+
+        Same row-by-row search as place_queens, but driven by a loop instead
+        of recursion so it can pause at every solution.  Column and diagonal
+        occupancy live in boolean arrays, so a legality check is O(1).
+
+        Args:
+            limit: stop after this many solutions (None = all)
+        """
+        n = self.n
+        if limit is not None and limit <= 0:
+            return
+        if n == 0:
+            yield []            # the empty board is the one (trivial) solution
+            return
+        Q = [0] * (n + 2)
+        col = [False] * (n + 1)
+        up = [False] * (2 * n + 1)     # / diagonal: r + j constant
+        down = [False] * (2 * n + 1)   # \ diagonal: r - j + n constant
+        found = 0
+        r = 1
+        while r >= 1:
+            # advance the queen of row r to its next legal column
+            j = Q[r]
+            if j:
+                col[j] = up[r + j] = down[r - j + n] = False
+            j += 1
+            while j <= n and (col[j] or up[r + j] or down[r - j + n]):
+                j += 1
+            if j > n:
+                Q[r] = 0
+                r -= 1          # row exhausted: backtrack
+                continue
+            Q[r] = j
+            col[j] = up[r + j] = down[r - j + n] = True
+            if r == n:
+                yield Q[1:n + 1]
+                found += 1
+                if found == limit:
+                    return
+            else:
+                r += 1
+
+    def write_solutions(self, sink, limit=None):
+        """
+        Stream solutions to a file in compact form: one line of column
+        indices per board ("2 4 1 3").  sink is a path or an open text file.
+
+        Returns:
+            number of solutions written
+        """
+        if isinstance(sink, (str, os.PathLike)):
+            with open(sink, "w") as f:
+                return self.write_solutions(f, limit)
+        written = 0
+        for sol in self.iter_solutions(limit):
+            sink.write(" ".join(map(str, sol)) + "\n")
+            written += 1
+        return written
+
+    def count(self, processes=None):
+        """Counting mode: number of solutions via count_solutions (nothing stored)."""
+        return count_solutions(self.n, processes)
+
     def combinations(self, n, k):
         """Calculate C(n,k) = n!/(k!(n-k)!)"""
         if k > n or k < 0:
@@ -119,12 +339,22 @@ class NQueensBacktracking:
         return result
     
     def print_solution(self, solution_index=0):
-        """Print a visual board for a specific solution."""
-        if not self.solutions or solution_index >= len(self.solutions):
+        """
+        Print a visual board for a specific solution.
+
+        Uses self.solutions when solve() has filled it; otherwise only that
+        one solution is generated on demand with iter_solutions.
+        """
+        if solution_index < len(self.solutions):
+            sol = self.solutions[solution_index]
+        elif self.solutions or solution_index < 0:
+            sol = None
+        else:
+            sol = next(islice(self.iter_solutions(solution_index + 1), solution_index, None), None)
+        if sol is None:
             print("No solution to display")
             return
         
-        sol = self.solutions[solution_index]
         print(f"\nSolution {solution_index + 1}: Q = {sol}")
         print(f"(Q[i] = column where queen is placed in row i)\n")
         
@@ -175,6 +405,99 @@ Example: If we have a queen at row 3, column 5, and we're checking row 6, column
 """)
 
 
+# ============================================================================
+# Counting mode: bitboards + mirror symmetry + multiprocessing
+# ============================================================================
+#
+# When only the number of solutions matters, the board can be three ints:
+#   cols = columns already taken
+#   ld   = squares attacked along / diagonals in the current row
+#   rd   = squares attacked along \ diagonals in the current row
+# Free squares in the row are ~(cols | ld | rd); moving down one row shifts
+# ld left and rd right.  No Q array, no O(r) legality loop, no solution list.
+#
+# Mirror symmetry: reflecting a board left-right maps a solution with the
+# first-row queen in column c to one with it in column n-1-c, so only the
+# left half of the first row is searched and doubled (plus the middle
+# column once when n is odd).  The (row 1, row 2) prefixes are independent
+# subtrees, which is what gets handed to the worker processes.
+
+def count_completions(full, cols, ld, rd):
+    """Number of ways to finish a partial board given as bitmasks."""
+    avail = full & ~(cols | ld | rd)
+    total = 0
+    while avail:
+        bit = avail & -avail
+        avail ^= bit
+        c = cols | bit
+        if c == full:
+            total += 1
+        else:
+            total += count_completions(full, c, (ld | bit) << 1 & full, (rd | bit) >> 1)
+    return total
+
+
+def _count_task(task):
+    """Worker entry point: (n, cols, ld, rd, weight) -> weighted count."""
+    n, cols, ld, rd, weight = task
+    return weight * count_completions((1 << n) - 1, cols, ld, rd)
+
+
+def symmetric_tasks(n):
+    """
+    Split the search into independent (row 1, row 2) prefixes (n >= 2;
+    count_solutions answers n <= 1 itself).
+
+    Returns:
+        list of (n, cols, ld, rd, weight) tuples; weight is 2 for first-row
+        columns in the left half (their mirror images are not searched) and
+        1 for the middle column of an odd board.
+    """
+    full = (1 << n) - 1
+    tasks = []
+    for c1 in range((n + 1) // 2):
+        weight = 1 if n % 2 and c1 == n // 2 else 2
+        bit = 1 << c1
+        cols, ld, rd = bit, (bit << 1) & full, bit >> 1
+        avail = full & ~(cols | ld | rd)
+        while avail:
+            b2 = avail & -avail
+            avail ^= b2
+            tasks.append((n, cols | b2, (ld | b2) << 1 & full, (rd | b2) >> 1, weight))
+    return tasks
+
+
+# Below this board size the serial count finishes (n=12: ~0.1s) in about
+# the time it takes to start a pool, so the default never creates one.
+POOL_MIN_N = 13
+
+
+def count_solutions(n, processes=None):
+    """
+    Count N-Queens solutions without building any of them.
+
+    Args:
+        n: board size
+        processes: worker processes (default: os.cpu_count() for
+            n >= POOL_MIN_N, serial below it; 1 = no pool)
+
+    Returns:
+        number of solutions
+    """
+    if n <= 0:
+        return 1 if n == 0 else 0
+    if n == 1:
+        return 1
+    tasks = symmetric_tasks(n)
+    if processes is None:
+        processes = (os.cpu_count() or 1) if n >= POOL_MIN_N else 1
+    if processes <= 1 or len(tasks) < 2:
+        return sum(map(_count_task, tasks))
+    from multiprocessing import Pool
+    with Pool(processes) as pool:
+        return sum(pool.imap_unordered(_count_task, tasks))
+
+
 def demonstrate_4queens_verbose():
     """Show detailed execution trace for 4-Queens."""
     print("\n" + "="*70)
@@ -186,7 +509,7 @@ def demonstrate_4queens_verbose():
     print("  3. Backtracks when no legal placement exists")
     print("  4. Recursively solves for the next row when legal\n")
     
-    solver = NQueensBacktracking(4)
+    solver = NQueensBacktracking(4, hooks=[Counters()])
     solver.solve(verbose=True)
     
     print("\nAll solutions found:")
@@ -200,7 +523,7 @@ def demonstrate_8queens():
     print("CLASSIC 8-QUEENS PROBLEM")
     print("="*70)
     
-    solver = NQueensBacktracking(8)
+    solver = NQueensBacktracking(8, hooks=[Counters()])
     solutions = solver.solve(verbose=False)
     
     # Show first few solutions
@@ -212,8 +535,60 @@ def demonstrate_8queens():
     solver.explain_diagonal_check()
 
 
+def demonstrate_hooks():
+    """Instrumentation is paid for only when a hook is installed."""
+    print("\n" + "="*70)
+    print("HOOKS: FAST PATH vs INSTRUMENTED (10-Queens)")
+    print("="*70)
+    for label, hooks in (("no hooks", []), ("Counters", [Counters()])):
+        solver = NQueensBacktracking(10, hooks=hooks)
+        start = time.perf_counter()
+        solver.place_queens(1)
+        print(f"  {label:10s} {time.perf_counter() - start:.3f}s  "
+              f"({len(solver.solutions)} solutions, {solver.recursive_calls:,} calls)")
+
+    print("\nSampled trace (every 400th node of 8-Queens):")
+    NQueensBacktracking(8, hooks=[SampledTrace(every=400)]).place_queens(1)
+
+    flame = FlameStacks(max_depth=1)
+    NQueensBacktracking(8, hooks=[flame]).place_queens(1)
+    print("\nFolded stacks for flamegraph.pl (8-Queens, depth 1):")
+    flame.dump()
+
+
+def demonstrate_lazy_solutions():
+    """Take a few solutions of a big board without enumerating all of them."""
+    print("\n" + "="*70)
+    print("LAZY SOLUTIONS: 20-Queens, first 3 only")
+    print("="*70)
+    solver = NQueensBacktracking(20)
+    for i, sol in enumerate(solver.iter_solutions(limit=3)):
+        print(f"  #{i + 1}: {' '.join(map(str, sol))}")
+    solver.print_solution(0)
+
+
+def demonstrate_fast_count(max_n=12):
+    """Counting mode versus the lecture solver."""
+    print("\n" + "="*70)
+    print("COUNTING MODE: BITBOARDS + SYMMETRY")
+    print("="*70)
+    for n in range(1, max_n + 1):
+        start = time.perf_counter()
+        total = count_solutions(n, processes=1)
+        print(f"  n={n:2d}: {total:8,} solutions  ({time.perf_counter() - start:.3f}s)")
+    print("\nFor bigger boards, spread over all cores:")
+    print("  python recursive_backtracking_N_Queens.py --count 16")
+
+
 # Main execution
 if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == '--count':
+        n = int(sys.argv[2])
+        start = time.perf_counter()
+        total = count_solutions(n)
+        print(f"{n}-Queens: {total:,} solutions in {time.perf_counter() - start:.2f}s")
+        sys.exit(0)
+
     print("""
 ╔════════════════════════════════════════════════════════════════════╗
 ║           N-QUEENS RECURSIVE BACKTRACKING                          ║
@@ -232,6 +607,11 @@ This implementation follows the PlaceQueens(Q[1..n], r) algorithm:
     
     # Classic 8-Queens
     demonstrate_8queens()
+
+    # Instrumentation hooks, lazy generation and counting only
+    demonstrate_hooks()
+    demonstrate_lazy_solutions()
+    demonstrate_fast_count()
     
     print("\n" + "="*70)
     print("KEY TAKEAWAYS")
@@ -1,7 +1,17 @@
 """
 Recursive Backtracking Template
 Based on lecture slide - general pattern for solving constraint satisfaction problems
+
+backtrack() below is the lecture pattern as written on the slide.  The
+examples run on BacktrackingEngine, which drives the same callbacks with
+an explicit stack, so search depth is not bounded by the recursion limit.
 """
+import heapq
+import os
+import time
+from array import array
+from collections import Counter
+from math import factorial
 
 def backtrack(state):
     """
@@ -98,41 +108,153 @@ def unmake_choice(state, choice):
     pass
 
 
+# ============================================================================
+# Reusable engine: the same callbacks, driven by an explicit stack
+# ============================================================================
+
+class BacktrackingEngine:
+    """
+    Runs the backtracking pattern for any problem object that provides
+
+        is_solution(state)           -> bool
+        get_choices(state)           -> iterable of choices (taken when the node is entered)
+        make_choice(state, choice)
+        unmake_choice(state, choice)
+        process_solution(state)      -> value recorded for this solution (optional)
+
+    (a module defining those functions, like this one, works too).
+
+    Instead of one Python frame per level, the engine keeps a stack of
+    (choice, remaining choices) pairs, so a search can be as deep as memory
+    allows.  Like the template, a solution node is reported and not expanded.
+
+    Modes:
+        "first": stop at the first solution, leaving state at that solution
+        "all":   list of every recorded solution
+        "count": number of solutions (process_solution is never called)
+
+    Limits: max_nodes caps make_choice calls, time_limit caps seconds.  When
+    one is hit the search stops early and self.stopped says which.
+    """
+
+    MODES = ("first", "all", "count")
+
+    def __init__(self, problem, mode="all", max_nodes=None, time_limit=None):
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}, got {mode!r}")
+        self.problem = problem
+        self.mode = mode
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        self.nodes = 0
+        self.elapsed = 0.0
+        self.stopped = None     # None, "nodes" or "time"
+
+    def _record(self, state):
+        process = getattr(self.problem, "process_solution", None)
+        return process(state) if process is not None else state
+
+    def iter_solutions(self, state=None, record=True, restore=True):
+        """
+        Yield solutions lazily (the recorded value, or None if record=False).
+
+        state defaults to the problem object itself, which is how the
+        example classes below keep their own state.  However the iteration
+        ends (exhausted, a limit, or the caller stopping early), every choice
+        still applied is unmade, unless restore=False -- that is how
+        mode="first" leaves state at its solution.
+        """
+        p = self.problem
+        if state is None:
+            state = p
+        is_solution, get_choices = p.is_solution, p.get_choices
+        make_choice, unmake_choice = p.make_choice, p.unmake_choice
+        max_nodes = self.max_nodes
+        deadline = None if self.time_limit is None else time.perf_counter() + self.time_limit
+        self.nodes = 0
+        self.stopped = None
+        start = time.perf_counter()
+        made = []                               # choices on the current path
+        try:
+            if is_solution(state):
+                yield self._record(state) if record else None
+                return
+            pending = [iter(get_choices(state))]  # untried choices per level
+            while pending:
+                choice = next(pending[-1], _EXHAUSTED)
+                if choice is _EXHAUSTED:
+                    pending.pop()
+                    if made:
+                        unmake_choice(state, made.pop())
+                    continue
+                if max_nodes is not None and self.nodes >= max_nodes:
+                    self.stopped = "nodes"
+                    return
+                if deadline is not None and not self.nodes & 1023 and time.perf_counter() > deadline:
+                    self.stopped = "time"
+                    return
+                self.nodes += 1
+                make_choice(state, choice)
+                made.append(choice)
+                if is_solution(state):
+                    yield self._record(state) if record else None
+                    unmake_choice(state, made.pop())
+                else:
+                    pending.append(iter(get_choices(state)))
+        finally:
+            if restore:
+                while made:
+                    unmake_choice(state, made.pop())
+            self.elapsed = time.perf_counter() - start
+
+    def run(self, state=None):
+        """Search in the configured mode; see the class docstring for results."""
+        if self.mode == "first":
+            for solution in self.iter_solutions(state, restore=False):
+                return solution
+            return None
+        if self.mode == "count":
+            return sum(1 for _ in self.iter_solutions(state, record=False))
+        return list(self.iter_solutions(state))
+
+
+_EXHAUSTED = object()
+
+
 # ============================================================================
 # Example 1: N-Queens Problem
 # ============================================================================
 
 class NQueensBacktrack:
+    """Place queens row by row; the object itself is the search state."""
+
     def __init__(self, n):
         self.n = n
         self.board = [-1] * n  # board[row] = column of queen
+        self.row = 0           # first empty row
         self.solutions = []
     
     def solve(self):
-        self.backtrack(0)
+        self.solutions = BacktrackingEngine(self, mode="all").run()
         return self.solutions
     
-    def backtrack(self, row):
-        """Place queens row by row."""
-        # Base case: placed all queens
-        if row == self.n:
-            self.solutions.append(self.board[:])
-            return False  # Continue searching for more solutions
-        
-        # Try each column in this row
-        for col in range(self.n):
-            if self.is_safe(row, col):
-                # Make choice
-                self.board[row] = col
-                
-                # Recurse
-                if self.backtrack(row + 1):
-                    return True
-                
-                # Unmake choice (backtrack)
-                self.board[row] = -1
-        
-        return False
+    # --- engine callbacks (state is self) ---
+    def is_solution(self, state):
+        return self.row == self.n          # placed all queens
+
+    def get_choices(self, state):
+        return [col for col in range(self.n) if self.is_safe(self.row, col)]
+
+    def make_choice(self, state, col):
+        self.board[self.row] = col
+        self.row += 1
+
+    def unmake_choice(self, state, col):
+        self.row -= 1
+        self.board[self.row] = -1
+
+    def process_solution(self, state):
+        return self.board[:]
     
     def is_safe(self, row, col):
         """Check if placing queen at (row, col) is valid."""
@@ -142,6 +264,44 @@ class NQueensBacktrack:
                 return False
         return True
 
+    def iter_solutions(self, limit=None):
+        """
+        Lazy version of solve(): yield boards one at a time, stop after limit.
+
+        The engine suspends at each solution and nothing is accumulated.
+        """
+        if limit is not None and limit <= 0:
+            return
+        found = 0
+        try:
+            for board in BacktrackingEngine(self).iter_solutions():
+                yield board
+                found += 1
+                if found == limit:
+                    break
+        finally:
+            # also runs when the caller stops early or calls close()
+            self.board[:] = [-1] * self.n
+            self.row = 0
+
+    def write_solutions(self, sink, limit=None):
+        """
+        Stream boards to a file in the same format as
+        NQueensBacktracking.write_solutions: one line of 1-based column
+        indices per board ("2 4 1 3").  sink is a path or an open text file.
+
+        Returns:
+            number of solutions written
+        """
+        if isinstance(sink, (str, os.PathLike)):
+            with open(sink, "w") as f:
+                return self.write_solutions(f, limit)
+        written = 0
+        for board in self.iter_solutions(limit):
+            sink.write(" ".join(str(c + 1) for c in board) + "\n")
+            written += 1
+        return written
+
 
 # ============================================================================
 # Example 2: Subset Sum Problem
@@ -156,41 +316,380 @@ class SubsetSumBacktrack:
         self.solutions = []
         self.current_subset = []
         self.current_sum = 0
+        self.index = 0         # next number to decide on
     
     def solve(self):
-        self.backtrack(0)
+        # Prune with the exact "can numbers[index:] still add up to what is
+        # missing?" test when the sums fit in a bitset, else with min/max
+        # bounds.  Both are also correct for negative numbers, unlike the
+        # old "current_sum > target" cut-off.
+        engine = SubsetSum(self.numbers, self.target)
+        self._reach = engine.suffix_reach()
+        self._offset = engine.offset
+        self._low, self._high = engine.suffix_bounds()
+        self.solutions = BacktrackingEngine(self, mode="all").run()
         return self.solutions
     
-    def backtrack(self, index):
-        """Try including/excluding each number."""
-        # Base case: found a solution
-        if self.current_sum == self.target:
-            self.solutions.append(self.current_subset[:])
+    # --- engine callbacks: each number is included (True) or excluded (False) ---
+    def is_solution(self, state):
+        return self.current_sum == self.target
+
+    def _feasible(self, index, missing):
+        """Can some subset of numbers[index:] sum to missing?"""
+        if self._reach is not None:
+            bit = missing + self._offset
+            return bit >= 0 and self._reach[index] >> bit & 1
+        return self._low[index] <= missing <= self._high[index]
+
+    def get_choices(self, state):
+        # explored all numbers: nothing left to choose
+        if self.index >= len(self.numbers):
+            return ()
+        missing = self.target - self.current_sum
+        x = self.numbers[self.index]
+        nxt = self.index + 1
+        # only branches from which the target is still reachable
+        return [include for include, need in ((True, missing - x), (False, missing))
+                if self._feasible(nxt, need)]
+
+    def make_choice(self, state, include):
+        if include:
+            self.current_subset.append(self.numbers[self.index])
+            self.current_sum += self.numbers[self.index]
+        self.index += 1
+
+    def unmake_choice(self, state, include):
+        self.index -= 1
+        if include:
+            self.current_subset.pop()
+            self.current_sum -= self.numbers[self.index]
+
+    def process_solution(self, state):
+        return self.current_subset[:]
+
+
+class SubsetSum:
+    """
+    Subset-sum engine for arbitrary integers (negatives and zeros allowed).
+
+    Sums are shifted by offset = -(sum of negatives) so every reachable sum
+    lives in [0, span] and can be a bit position or an array index:
+        decide()              Python-int bitset, reachable |= reachable << x
+        count()               array('q') DP over [0, span], or meet in the
+                              middle when that is cheaper
+        iter_subsets()        enumerates every subset (by position) hitting
+                              target, walking only branches the suffix
+                              bitsets (or, for wide spans, suffix min/max
+                              bounds) say are still feasible
+        count_meet_in_middle() / decide_meet_in_middle()
+                              for n <= 40 with huge values, where a
+                              span-sized bitset or array is out of reach
+    """
+
+    BITSET_LIMIT = 1 << 26      # largest span decide() builds a bitset for
+    COUNT_LIMIT = 1 << 22       # largest span count() builds an array for
+    REACH_LIMIT = 1 << 29       # bits (64 MB) across all suffix bitsets
+    MITM_LIMIT = 40
+
+    def __init__(self, numbers, target):
+        self.numbers = list(numbers)
+        self.target = target
+        self.offset = -sum(x for x in self.numbers if x < 0)
+        self.span = self.offset + sum(x for x in self.numbers if x > 0)
+
+    @staticmethod
+    def _shift(bits, x):
+        """Add x to every sum in a bitset (keeps the old sums too)."""
+        return bits | (bits << x if x >= 0 else bits >> -x)
+
+    def _target_bit(self):
+        bit = self.target + self.offset
+        return bit if 0 <= bit <= self.span else None
+
+    def _too_wide(self):
+        """
+        True when the span is too big for a bitset / array, so the caller
+        must use meet in the middle; raises if that is not possible either.
+        """
+        if self.span <= self.BITSET_LIMIT:
+            return False
+        if len(self.numbers) > self.MITM_LIMIT:
+            raise ValueError(
+                f"sums span {self.span:,} (> {self.BITSET_LIMIT:,}) and n = {len(self.numbers)} "
+                f"> {self.MITM_LIMIT}: too large for both the DP and meet in the middle")
+        return True
+
+    def decide(self):
+        """Is there a subset summing to target?  (Meet in the middle for huge values.)"""
+        bit = self._target_bit()
+        if bit is None:
+            return False
+        if self._too_wide():
+            return self.decide_meet_in_middle()
+        reach = 1 << self.offset
+        for x in self.numbers:
+            reach = self._shift(reach, x)
+        return bool(reach >> bit & 1)
+
+    def suffix_reach(self):
+        """
+        reach[i] = bitset of sums (+ offset) reachable with numbers[i:], or
+        None when the n + 1 bitsets would exceed REACH_LIMIT bits.
+        """
+        if (len(self.numbers) + 1) * (self.span + 1) > self.REACH_LIMIT:
+            return None
+        reach = [0] * (len(self.numbers) + 1)
+        reach[-1] = 1 << self.offset
+        for i in range(len(self.numbers) - 1, -1, -1):
+            reach[i] = self._shift(reach[i + 1], self.numbers[i])
+        return reach
+
+    def suffix_bounds(self):
+        """low[i], high[i] = smallest / largest subset sum of numbers[i:]."""
+        low, high = [0], [0]
+        for x in reversed(self.numbers):
+            low.append(low[-1] + min(x, 0))
+            high.append(high[-1] + max(x, 0))
+        low.reverse()
+        high.reverse()
+        return low, high
+
+    def _count_by_mitm(self):
+        """
+        Pick count()'s engine by cost: the DP touches about n * span cells,
+        meet in the middle about 2^(n/2) sums per half (with a constant for
+        the Counter work).
+        """
+        n = len(self.numbers)
+        mitm_ok = n <= self.MITM_LIMIT
+        if self.span > self.COUNT_LIMIT:
+            if not mitm_ok:
+                raise ValueError(
+                    f"sums span {self.span:,} (> {self.COUNT_LIMIT:,}) and n = {n} "
+                    f"> {self.MITM_LIMIT}: too large for both the DP and meet in the middle")
+            return True
+        return mitm_ok and 16 * 2 ** ((n + 1) // 2) < n * (self.span + 1)
+
+    def count(self):
+        """
+        Number of subsets (chosen by position) summing to target.
+
+        For each nonzero number, one in-place pass over its slice of the
+        count array: ways[s] += ways[s - x], running away from the sums it
+        reads so each subset uses x at most once.  Each zero just doubles
+        the answer.  Counts are at most 2^n, so array('q') is safe for
+        n < 63; beyond that plain ints are used.  When meet in the middle
+        is cheaper (or the span exceeds COUNT_LIMIT) it is used instead.
+        """
+        bit = self._target_bit()
+        if bit is None:
+            return 0
+        if self._count_by_mitm():
+            return self.count_meet_in_middle()
+        size = self.span + 1
+        ways = array('q', bytes(8 * size)) if len(self.numbers) < 63 else [0] * size
+        ways[self.offset] = 1
+        zeros = 0
+        for x in self.numbers:
+            if x > 0:
+                for s in range(size - 1, x - 1, -1):
+                    ways[s] += ways[s - x]
+            elif x < 0:
+                for s in range(size + x):
+                    ways[s] += ways[s - x]
+            else:
+                zeros += 1
+        return ways[bit] << zeros
+
+    def iter_subsets(self, limit=None):
+        """
+        Yield subsets (lists of values, in input order) summing to target.
+
+        Include-before-exclude order, explicit stack, and every branch taken
+        is known to lead to at least one answer, so the work is O(n) per
+        subset yielded.  When the suffix bitsets would be too big, branches
+        are pruned with suffix min/max bounds instead: still correct, but
+        dead subtrees are no longer ruled out exactly.
+        """
+        numbers, n = self.numbers, len(self.numbers)
+        if self._target_bit() is None or (limit is not None and limit <= 0):
             return
-        
-        # Base case: explored all numbers or exceeded target
-        if index >= len(self.numbers) or self.current_sum > self.target:
+        reach = self.suffix_reach()
+        offset, span = self.offset, self.span
+        if reach is not None:
+            def feasible(i, missing):
+                bit = missing + offset
+                return 0 <= bit <= span and reach[i] >> bit & 1
+        else:
+            low, high = self.suffix_bounds()
+
+            def feasible(i, missing):
+                return low[i] <= missing <= high[i]
+
+        if not feasible(0, self.target):
             return
-        
-        # Choice 1: Include current number
-        self.current_subset.append(self.numbers[index])
-        self.current_sum += self.numbers[index]
-        self.backtrack(index + 1)
-        # Backtrack
-        self.current_subset.pop()
-        self.current_sum -= self.numbers[index]
-        
-        # Choice 2: Exclude current number
-        self.backtrack(index + 1)
+        found = 0
+        chosen = []
+        # (index, missing, include branch not tried yet); None = undo an include
+        stack = [(0, self.target, True)]
+        while stack:
+            i, missing, fresh = stack.pop()
+            if i is None:
+                chosen.pop()
+                continue
+            if i == n:
+                yield chosen[:]
+                found += 1
+                if found == limit:
+                    return
+                continue
+            x = numbers[i]
+            if fresh:
+                # include first; the exclude branch waits underneath
+                stack.append((i, missing, False))
+                if feasible(i + 1, missing - x):
+                    chosen.append(x)
+                    stack.append((None, None, None))
+                    stack.append((i + 1, missing - x, True))
+            elif feasible(i + 1, missing):
+                stack.append((i + 1, missing, True))
+
+    def _half_sums(self, half):
+        sums = [0]
+        for x in half:
+            sums += [s + x for s in sums]
+        return sums
+
+    def _split(self):
+        if len(self.numbers) > self.MITM_LIMIT:
+            raise ValueError(f"meet in the middle needs n <= {self.MITM_LIMIT}, got {len(self.numbers)}")
+        mid = len(self.numbers) // 2
+        return self._half_sums(self.numbers[:mid]), Counter(self._half_sums(self.numbers[mid:]))
+
+    def count_meet_in_middle(self):
+        """count() in O(2^(n/2)) time and memory, independent of the values."""
+        left, right = self._split()
+        target = self.target
+        return sum(right.get(target - s, 0) for s in left)
+
+    def decide_meet_in_middle(self):
+        """decide() in O(2^(n/2)), independent of the values."""
+        left, right = self._split()
+        target = self.target
+        return any(target - s in right for s in left)
 
 
 # ============================================================================
 # Example 3: Maze Solver
 # ============================================================================
 
+class GridMaze:
+    """
+    A maze stored as one flat bytearray, for shortest paths on big grids.
+
+    The grid gets a one-cell wall border, so cell (r, c) lives at
+    (r + 1) * width + (c + 1) and its neighbours are index + offset for a
+    fixed offset tuple: no bounds checks, no tuples, no visited set.
+    Searches are iterative and record parents in an array('i').
+    """
+
+    WALL = 1
+    OPEN = 0
+
+    def __init__(self, maze):
+        self.rows = len(maze)
+        self.cols = len(maze[0]) if maze else 0
+        self.width = width = self.cols + 2
+        self.cells = bytearray([self.WALL]) * ((self.rows + 2) * width)
+        for r, row in enumerate(maze):
+            base = (r + 1) * width + 1
+            self.cells[base:base + self.cols] = bytes(self.WALL if v == 1 else self.OPEN for v in row)
+        # same order as the backtracking solver: right, down, left, up
+        self.offsets = (1, width, -1, -width)
+
+    def index(self, pos):
+        return (pos[0] + 1) * self.width + pos[1] + 1
+
+    def position(self, index):
+        r, c = divmod(index, self.width)
+        return (r - 1, c - 1)
+
+    def inside(self, pos):
+        return 0 <= pos[0] < self.rows and 0 <= pos[1] < self.cols
+
+    def _path(self, parent, start, end):
+        path = [end]
+        while end != start:
+            end = parent[end]
+            path.append(end)
+        path.reverse()
+        return [self.position(i) for i in path]
+
+    def bfs(self, start, end):
+        """Shortest path as a list of (row, col), or None if unreachable."""
+        if not (self.inside(start) and self.inside(end)):
+            return None
+        cells, offsets = self.cells, self.offsets
+        s, t = self.index(start), self.index(end)
+        if cells[s] == self.WALL:
+            return None
+        parent = array('i', [-1]) * len(cells)
+        parent[s] = s
+        frontier = [s]
+        while frontier and parent[t] < 0:
+            nxt = []
+            for p in frontier:
+                for d in offsets:
+                    q = p + d
+                    if parent[q] < 0 and not cells[q]:
+                        parent[q] = p
+                        nxt.append(q)
+            frontier = nxt
+        return self._path(parent, s, t) if parent[t] >= 0 else None
+
+    def astar(self, start, end):
+        """
+        Shortest path via A* with the Manhattan-distance heuristic.
+
+        Manhattan distance never overestimates on a 4-connected grid and is
+        consistent, so the first time end is popped its distance is final.
+        """
+        if not (self.inside(start) and self.inside(end)):
+            return None
+        cells, offsets, width = self.cells, self.offsets, self.width
+        s, t = self.index(start), self.index(end)
+        if cells[s] == self.WALL:
+            return None
+        tr, tc = divmod(t, width)
+        parent = array('i', [-1]) * len(cells)
+        dist = array('i', [-1]) * len(cells)
+        parent[s] = s
+        dist[s] = 0
+        r, c = divmod(s, width)
+        heap = [(abs(r - tr) + abs(c - tc), 0, s)]
+        while heap:
+            f, g, p = heapq.heappop(heap)
+            if p == t:
+                return self._path(parent, s, t)
+            if g > dist[p]:
+                continue                    # stale heap entry
+            g += 1
+            for d in offsets:
+                q = p + d
+                if cells[q] or -1 < dist[q] <= g:
+                    continue
+                dist[q] = g
+                parent[q] = p
+                r, c = divmod(q, width)
+                heapq.heappush(heap, (g + abs(r - tr) + abs(c - tc), g, q))
+        return None
+
+
 class MazeSolver:
-    """Find path through maze using backtracking."""
+    """Find path through maze: shortest by BFS / A*, or by backtracking."""
     
+    METHODS = ("bfs", "astar", "backtrack")
+
     def __init__(self, maze, start, end):
         self.maze = maze  # 2D array: 0=open, 1=wall
         self.start = start
@@ -198,39 +697,63 @@ class MazeSolver:
         self.path = []
         self.visited = set()
     
-    def solve(self):
-        if self.backtrack(self.start):
-            return self.path
-        return None
+    def solve(self, method="bfs"):
+        """
+        Return a path from start to end as a list of (row, col), or None.
+
+        "bfs" and "astar" return a shortest path using GridMaze.
+        "backtrack" is the lecture search on BacktrackingEngine.  It returns
+        the first path found, not necessarily a shortest one.
+        As in the backtracking search, the end cell counts as reachable
+        even when it is marked as a wall.
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"method must be one of {self.METHODS}, got {method!r}")
+        if method != "backtrack":
+            if self.start == self.end:
+                self.path = [self.start]
+                return self.path
+            grid = GridMaze(self.maze)
+            if grid.inside(self.end):
+                grid.cells[grid.index(self.end)] = GridMaze.OPEN
+            path = grid.bfs(self.start, self.end) if method == "bfs" else grid.astar(self.start, self.end)
+            self.path = path or []
+            return path
+
+        self.path, self.visited = [], set()
+        if self.start != self.end:
+            if not self.is_valid(self.start):
+                return None
+            self.visited.add(self.start)
+        self.path.append(self.start)
+        # "first" mode leaves the state at the solution, i.e. path is the answer
+        if BacktrackingEngine(self, mode="first").run() is None:
+            return None
+        return self.path
     
-    def backtrack(self, pos):
-        """Try to find path from current position to end."""
-        row, col = pos
-        
-        # Base case: reached end
-        if pos == self.end:
-            self.path.append(pos)
-            return True
-        
-        # Check if valid position
-        if not self.is_valid(pos):
-            return False
-        
-        # Make choice: visit this cell
-        self.visited.add(pos)
-        self.path.append(pos)
-        
-        # Try all four directions
+    # --- engine callbacks: path[-1] is the current cell ---
+    def is_solution(self, state):
+        return self.path[-1] == self.end
+
+    def get_choices(self, state):
+        row, col = self.path[-1]
+        moves = []
         for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
             next_pos = (row + dr, col + dc)
-            if self.backtrack(next_pos):
-                return True
-        
-        # Backtrack: unvisit this cell
+            if next_pos == self.end or self.is_valid(next_pos):
+                moves.append(next_pos)
+        return moves
+
+    def make_choice(self, state, pos):
+        self.visited.add(pos)
+        self.path.append(pos)
+
+    def unmake_choice(self, state, pos):
         self.path.pop()
-        self.visited.remove(pos)
-        
-        return False
+        self.visited.discard(pos)
+
+    def process_solution(self, state):
+        return self.path
     
     def is_valid(self, pos):
         """Check if position is valid and unvisited."""
@@ -260,29 +783,171 @@ class PermutationGenerator:
         self.used = [False] * len(items)
     
     def generate(self):
-        self.backtrack()
+        self.permutations = BacktrackingEngine(self, mode="all").run()
         return self.permutations
     
-    def backtrack(self):
-        """Build permutations one element at a time."""
-        # Base case: built complete permutation
-        if len(self.current) == len(self.items):
-            self.permutations.append(self.current[:])
-            return
-        
-        # Try each unused item
-        for i in range(len(self.items)):
-            if not self.used[i]:
-                # Make choice
-                self.current.append(self.items[i])
-                self.used[i] = True
-                
-                # Recurse
-                self.backtrack()
-                
-                # Backtrack
-                self.current.pop()
-                self.used[i] = False
+    # --- engine callbacks: a choice is the index of an unused item ---
+    def is_solution(self, state):
+        return len(self.current) == len(self.items)
+
+    def get_choices(self, state):
+        return [i for i in range(len(self.items)) if not self.used[i]]
+
+    def make_choice(self, state, i):
+        self.current.append(self.items[i])
+        self.used[i] = True
+
+    def unmake_choice(self, state, i):
+        self.current.pop()
+        self.used[i] = False
+
+    def process_solution(self, state):
+        return self.current[:]
+
+    # --- streaming API: O(n) memory however many permutations are visited ---
+    def iter_permutations(self):
+        """Same permutations, same order as generate(), yielded one at a time."""
+        return iter_permutations(self.items)
+
+    def rank(self, perm):
+        """Position of perm in generate() order (items must be distinct)."""
+        where = {item: i for i, item in enumerate(self.items)}
+        return rank([where[item] for item in perm])
+
+    def unrank(self, index):
+        """The permutation generate() would list at position index."""
+        return [self.items[i] for i in unrank(index, len(self.items))]
+
+
+# ----------------------------------------------------------------------------
+# Permutation engine: iterative generation, rank/unrank, sharded search
+# ----------------------------------------------------------------------------
+#
+# Permutations are handled as orderings of positions 0..n-1, so items may be
+# anything (even repeated).  Lexicographic order on positions is exactly the
+# order the backtracking generator produces, which lets rank/unrank address
+# it directly: index i written in the factorial number system
+# (d_{n-1} * (n-1)! + ... + d_0 * 0!) says "take the d-th unused position"
+# at each step.
+
+def next_permutation(a):
+    """Rearrange list a into its lexicographic successor in place; False after the last."""
+    i = len(a) - 2
+    while i >= 0 and a[i] >= a[i + 1]:
+        i -= 1
+    if i < 0:
+        return False
+    j = len(a) - 1
+    while a[j] <= a[i]:
+        j -= 1
+    a[i], a[j] = a[j], a[i]
+    a[i + 1:] = a[:i:-1]
+    return True
+
+
+def iter_permutations(items, start=0, stop=None):
+    """
+    Yield permutations of items (as lists) in lexicographic position order,
+    from rank start up to (not including) stop.  Only the current ordering
+    is kept, so memory is O(n).
+    """
+    n = len(items)
+    stop = factorial(n) if stop is None else min(stop, factorial(n))
+    if start >= stop:
+        return
+    order = unrank(start, n)
+    for _ in range(stop - start - 1):
+        yield [items[i] for i in order]
+        next_permutation(order)
+    yield [items[i] for i in order]
+
+
+def heap_permutations(items):
+    """
+    Heap's algorithm, iteratively: every permutation differs from the
+    previous one by a single swap (not in lexicographic order).
+    """
+    a = list(items)
+    n = len(a)
+    c = [0] * n
+    yield a[:]
+    i = 1
+    while i < n:
+        if c[i] < i:
+            j = c[i] if i % 2 else 0
+            a[j], a[i] = a[i], a[j]
+            yield a[:]
+            c[i] += 1
+            i = 1
+        else:
+            c[i] = 0
+            i += 1
+
+
+def rank(perm):
+    """Lexicographic rank of a permutation of 0..n-1 (inverse of unrank)."""
+    n = len(perm)
+    r = 0
+    for i, p in enumerate(perm):
+        smaller = sum(1 for q in perm[i + 1:] if q < p)   # Lehmer code digit
+        r += smaller * factorial(n - 1 - i)
+    return r
+
+
+def unrank(index, n):
+    """The index-th permutation of 0..n-1 in lexicographic order."""
+    if not 0 <= index < factorial(n):
+        raise ValueError(f"rank {index} out of range for n={n}")
+    pool = list(range(n))
+    perm = []
+    for k in range(n - 1, -1, -1):
+        digit, index = divmod(index, factorial(k))
+        perm.append(pool.pop(digit))
+    return perm
+
+
+def _scan_shard(task):
+    """Worker: check predicate on ranks [start, stop)."""
+    items, predicate, start, stop, count_only = task
+    if count_only:
+        return sum(1 for perm in iter_permutations(items, start, stop) if predicate(perm))
+    return [perm for perm in iter_permutations(items, start, stop) if predicate(perm)]
+
+
+def search_permutations(items, predicate, processes=None, shards=None, count_only=False):
+    """
+    Evaluate predicate on every permutation of items, in parallel.
+
+    The rank range [0, n!) is cut into contiguous shards; each worker
+    unranks its start and walks forward with next_permutation, so no
+    permutation list is ever built.  predicate must be picklable (a
+    module-level function).
+
+    Returns:
+        the number of matches if count_only, else the matching permutations
+        in lexicographic order
+    """
+    total = factorial(len(items))
+    if processes is None:
+        processes = os.cpu_count() or 1
+    shards = shards or max(1, 4 * processes)
+    step = -(-total // shards)
+    tasks = [(list(items), predicate, lo, min(lo + step, total), count_only)
+             for lo in range(0, total, step)]
+    if processes <= 1 or len(tasks) < 2:
+        results = map(_scan_shard, tasks)
+    else:
+        from multiprocessing import Pool
+        with Pool(processes) as pool:
+            results = pool.map(_scan_shard, tasks)
+    if count_only:
+        return sum(results)
+    return [perm for part in results for perm in part]
+
+
+def is_derangement(perm):
+    """Example predicate: no element of range(n) stays in its own position."""
+    return all(p != i for i, p in enumerate(perm))
 
 
 # ============================================================================
@@ -300,6 +965,8 @@ if __name__ == "__main__":
     solutions = queens.solve()
     print(f"   Found {len(solutions)} solutions")
     print(f"   First solution: {solutions[0]}")
+    first_two = list(NQueensBacktrack(8).iter_solutions(limit=2))
+    print(f"   Lazy, 8x8, first two only: {first_two}")
     
     # Example 2: Subset Sum
     print("\n2. Subset Sum ([1,2,3,4,5], target=7):")
@@ -308,6 +975,18 @@ if __name__ == "__main__":
     print(f"   Found {len(solutions)} solutions")
     for sol in solutions:
         print(f"   {sol} -> sum = {sum(sol)}")
+
+    # SubsetSum engine: negatives allowed, sizes far beyond 2^n branching
+    import random
+    rng = random.Random(0)
+    numbers = [rng.randint(-50, 100) for _ in range(60)]
+    engine = SubsetSum(numbers, 700)
+    print(f"   n=60 with negatives, target 700: exists={engine.decide()}, "
+          f"count={engine.count():,}")
+    print(f"   first subset: {next(engine.iter_subsets())}")
+    huge = [rng.randint(1, 10**12) for _ in range(30)]
+    print(f"   n=30, values up to 10^12: "
+          f"{SubsetSum(huge, sum(huge[::2])).count_meet_in_middle()} subset(s) via meet in the middle")
     
     # Example 3: Maze
     print("\n3. Maze Solver:")
@@ -320,6 +999,24 @@ if __name__ == "__main__":
     solver = MazeSolver(maze, (0, 0), (3, 3))
     path = solver.solve()
     print(f"   Path found: {path}")
+
+    # A 1 x 1500 corridor is deeper than the default recursion limit allows
+    # with one Python frame per cell; the engine's explicit stack copes.
+    width = 1500
+    corridor = [[0] * width]
+    engine_solver = MazeSolver(corridor, (0, 0), (0, width - 1))
+    print(f"   1 x {width} corridor (backtrack): path of {len(engine_solver.solve('backtrack'))} cells")
+
+    # Shortest paths on a big random grid
+    size = 400
+    grid = [[1 if rng.random() < 0.3 else 0 for _ in range(size)] for _ in range(size)]
+    grid[0][0] = grid[size - 1][size - 1] = 0
+    for method in ("bfs", "astar"):
+        start = time.perf_counter()
+        path = MazeSolver(grid, (0, 0), (size - 1, size - 1)).solve(method)
+        length = len(path) if path else None
+        print(f"   {size}x{size} random maze, {method:5s}: {length} cells "
+              f"({time.perf_counter() - start:.3f}s)")
     
     # Example 4: Permutations
     print("\n4. Permutations of [1,2,3]:")
@@ -328,6 +1025,18 @@ if __name__ == "__main__":
     print(f"   Found {len(perms)} permutations")
     for p in perms:
         print(f"   {p}")
+    print(f"   rank of [3, 1, 2] = {perm.rank([3, 1, 2])}, unrank(4) = {perm.unrank(4)}")
+    start = time.perf_counter()
+    derangements = search_permutations(list(range(9)), is_derangement, count_only=True)
+    print(f"   derangements of 9 items, sharded over a process pool: {derangements:,} "
+          f"({time.perf_counter() - start:.2f}s)")
+
+    # Engine modes and limits
+    print("\n5. BacktrackingEngine modes (8-Queens):")
+    print(f"   count: {BacktrackingEngine(NQueensBacktrack(8), mode='count').run()}")
+    print(f"   first: {BacktrackingEngine(NQueensBacktrack(8), mode='first').run()}")
+    limited = BacktrackingEngine(NQueensBacktrack(12), mode="count", max_nodes=5000)
+    print(f"   12-Queens with max_nodes=5000: {limited.run()} solutions, stopped by {limited.stopped}")
     
     print("\n" + "="*70)
     print("KEY PATTERN:")
@@ -1,3 +1,11 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # numpy mode is optional
+    np = None
+
+
 def count_recur(coins, n, s, memo):
     # Base cases
     if s == 0:
@@ -70,3 +78,268 @@ if __name__ == "__main__":
     print("\nDP table (rows i=0..n, cols s=0..amount):")
     for i, row in enumerate(dp_table):
         print(f"i={i}:", row)
+
+
+
+# ============================================================================
+# Unified engine: iterative, no 2-D table, optional modulus
+# ============================================================================
+#
+# All three versions above keep something of size (n+1) x (amount+1) (or a
+# dict entry per (n, sum)) and the recursive ones go amount/min(coin) frames
+# deep, so amounts past a few thousand fail.  The engine below needs one
+# array of size amount+1 at most, never recurses, and can work modulo `mod`
+# so the numbers stay machine-sized when only the residue is wanted.
+
+
+def count_ways_1d(coins, amount, mod=None):
+    """
+    1-D in-place DP: dp[s] = ways to make s with the coins processed so far.
+
+    Coins are the outer loop (so orderings are not counted) and s runs
+    upwards, so dp[s - coin] already includes the current coin -> unlimited
+    reuse.  This is exactly row i of the 2-D table overwriting row i-1.
+    """
+    return _expand(coins, amount, mod)[amount]
+
+
+def count_ways_numpy(coins, amount, mod):
+    """
+    Vectorized 1-D DP modulo mod (int64, so the modulus is required).
+
+    After adding coin c, dp[s] = sum of old dp[s - t*c] for t >= 0: a
+    running sum along each residue class mod c.  Viewing dp as a
+    (rows x c) matrix makes that a cumsum down axis 0.  The cumsum is done
+    in chunks of rows small enough that a chunk sum of values < mod cannot
+    overflow int64, reducing mod after every chunk.
+    """
+    if np is None:
+        raise RuntimeError("count_ways_numpy needs numpy installed")
+    if not mod or mod <= 0 or mod >= 1 << 62:
+        raise ValueError("count_ways_numpy needs a modulus 0 < mod < 2**62")
+    dp = np.zeros(amount + 1, dtype=np.int64)
+    dp[0] = 1 % mod
+    chunk = max(1, ((1 << 63) - 1) // mod - 1)   # rows per overflow-free cumsum
+    for coin in coins:
+        if coin > amount:
+            continue
+        rows = -(-(amount + 1) // coin)
+        grid = np.zeros(rows * coin, dtype=np.int64)
+        grid[:amount + 1] = dp
+        grid = grid.reshape(rows, coin)
+        carry = np.zeros(coin, dtype=np.int64)
+        for start in range(0, rows, chunk):
+            block = grid[start:start + chunk]
+            np.cumsum(block, axis=0, out=block)
+            block += carry
+            block %= mod
+            carry = block[-1].copy()
+        dp = grid.ravel()[:amount + 1]
+    return int(dp[amount])
+
+
+def _coin_polynomial(coins, mod=None):
+    """Coefficients q[0..D] of Q(x) = prod(1 - x^c); the answers are 1/Q(x)."""
+    q = [1]
+    for coin in coins:
+        nxt = q + [0] * coin
+        for k, coef in enumerate(q):
+            nxt[k + coin] -= coef
+        q = nxt if mod is None else [coef % mod for coef in nxt]
+    return q
+
+
+def _nth_term(q, initial, n, mod=None):
+    """
+    a_n for the linear recurrence a_n = -(q_1 a_{n-1} + ... + q_D a_{n-D})
+    given a_0..a_{D-1}, via x^n mod the characteristic polynomial
+    (Kitamasa): O(D^2 log n) instead of O(n).
+    """
+    D = len(q) - 1
+
+    def mulmod(a, b):
+        prod = [0] * (2 * D - 1)
+        for i, x in enumerate(a):
+            if x:
+                for j, y in enumerate(b):
+                    prod[i + j] += x * y
+        # x^D = -(q_1 x^{D-1} + ... + q_D), reduce from the top down
+        for k in range(2 * D - 2, D - 1, -1):
+            top = prod[k]
+            if top:
+                for t in range(1, D + 1):
+                    prod[k - t] -= top * q[t]
+        res = prod[:D]
+        return res if mod is None else [x % mod for x in res]
+
+    result = [1] + [0] * (D - 1)           # x^0
+    base = [0, 1] + [0] * (D - 2) if D > 1 else [-q[1]]  # x^1 (reduced if D == 1)
+    if mod is not None:
+        base = [x % mod for x in base]
+    while n:
+        if n & 1:
+            result = mulmod(result, base)
+        base = mulmod(base, base)
+        n >>= 1
+    total = sum(r * a for r, a in zip(result, initial))
+    return total if mod is None else total % mod
+
+
+def count_ways_gf(coins, amounts, mod=None):
+    """
+    Generating-function mode: answer many amounts for one coin set.
+
+    The number of ways is the coefficient of x^s in 1/prod(1 - x^c).  If
+    the largest amount is modest the series is expanded once (one 1-D DP
+    pass) and every query is read off.  Otherwise the coefficients obey a
+    linear recurrence of order D = sum(coins), and each big amount is
+    jumped to directly in O(D^2 log s) -- fine for amounts like 10^18 with
+    a small coin set, with or without a modulus.
+
+    Returns:
+        list of answers, in the same order as amounts
+    """
+    amounts = list(amounts)
+    if not amounts:
+        return []
+    coins = [c for c in coins if c > 0]
+    top = max(amounts)
+    D = sum(coins)
+    if D == 0 or top <= 64 * D:
+        series = _expand(coins, top, mod)
+        return [series[s] for s in amounts]
+
+    q = _coin_polynomial(coins, mod)
+    initial = _expand(coins, D - 1, mod)
+    return [initial[s] if s < D else _nth_term(q, initial, s, mod) for s in amounts]
+
+
+def _expand(coins, amount, mod=None):
+    """Full 1-D DP row: ways for every s in 0..amount (see count_ways_1d)."""
+    dp = [1 % mod if mod else 1] + [0] * amount
+    for coin in coins:
+        for s in range(coin, amount + 1):
+            if mod is None:
+                dp[s] += dp[s - coin]
+            else:
+                dp[s] = (dp[s] + dp[s - coin]) % mod
+    return dp
+
+
+def count_ways_fast(coins, amount, mod=None, mode="auto"):
+    """
+    Unified entry point.
+
+    Args:
+        coins: positive coin values (each usable any number of times)
+        amount: target sum
+        mod: optional modulus; None gives the exact (big) integer
+        mode: "1d", "numpy" (needs mod), "gf", or "auto" (numpy when a
+              modulus is given and numpy is installed, otherwise 1d)
+    """
+    if mode == "auto":
+        mode = "numpy" if mod is not None and np is not None and mod < 1 << 62 else "1d"
+    if mode == "1d":
+        return count_ways_1d(coins, amount, mod)
+    if mode == "numpy":
+        return count_ways_numpy(coins, amount, mod)
+    if mode == "gf":
+        return count_ways_gf(coins, [amount], mod)[0]
+    raise ValueError(f"unknown mode: {mode!r}")
+
+
+# ============================================================================
+# Batch queries: one DP pass for many amounts
+# ============================================================================
+
+
+class CoinChangeTable:
+    """
+    Number of ways for every amount 0..size of one fixed coin set.
+
+    Built once up to the largest amount asked for, then each query is a
+    list/array lookup.  Asking for a larger amount extends the table in
+    place instead of starting over.
+
+    Extending works because row i of the 2-D table only needs
+    row_i[s - c_i] and row_{i-1}[s].  So besides the final row we keep, per
+    coin, a ring of its last c_i row values indexed by s % c_i:
+        v = [s == 0]
+        for each coin c:  v += ring_c[s % c];  ring_c[s % c] = v
+    That is O(len(coins)) per new amount and O(sum(coins)) extra memory.
+
+    With a modulus (< 2**63) the final row is an array('q') of machine
+    ints; without one it is a plain list of exact Python ints.
+    """
+
+    def __init__(self, coins, amounts=(), mod=None):
+        """
+        Args:
+            coins: positive coin values
+            amounts: optional amounts to build for right away
+            mod: optional modulus for the stored counts
+        """
+        self.coins = [c for c in coins if c > 0]
+        self.mod = mod
+        self._rings = [[0] * c for c in self.coins]
+        if mod is not None and 0 < mod <= 1 << 63:
+            self.ways = array('q')
+        else:
+            self.ways = []
+        amounts = list(amounts)
+        if amounts:
+            self.extend(max(amounts))
+
+    @property
+    def size(self):
+        """Largest amount currently in the table (-1 when empty)."""
+        return len(self.ways) - 1
+
+    def extend(self, amount):
+        """Make sure the table covers 0..amount."""
+        start = len(self.ways)
+        if amount < start:
+            return
+        mod = self.mod
+        new = [0] * (amount + 1 - start)
+        pairs = list(zip(self.coins, self._rings))
+        for s in range(start, amount + 1):
+            v = 1 if s == 0 else 0
+            for coin, ring in pairs:
+                slot = s % coin
+                v += ring[slot]
+                if mod is not None:
+                    v %= mod
+                ring[slot] = v
+            new[s - start] = v
+        self.ways.extend(new)
+
+    def query(self, amount):
+        """Ways to make amount (grows the table, at least doubling, if needed)."""
+        if amount > self.size:
+            self.extend(max(amount, 2 * self.size))
+        return self.ways[amount]
+
+    __getitem__ = query
+
+    def query_many(self, amounts):
+        """Answer a batch: one extension to the largest amount, then lookups."""
+        amounts = list(amounts)
+        if amounts:
+            self.extend(max(amounts))
+        ways = self.ways
+        return [ways[a] for a in amounts]
+
+
+if __name__ == "__main__":
+    coins = [1, 5, 10, 25]
+    print("\nUnified engine (no 2-D table, no recursion):")
+    print("  1d,    amount=10000:", count_ways_fast(coins, 10000, mode="1d"))
+    print("  gf,    amount=10000:", count_ways_fast(coins, 10000, mode="gf"))
+    if np is not None:
+        print("  numpy, amount=10^6 mod 1e9+7:", count_ways_fast(coins, 10**6, 10**9 + 7))
+    print("  gf,    amount=10^18 mod 1e9+7:", count_ways_fast(coins, 10**18, 10**9 + 7, mode="gf"))
+
+    table = CoinChangeTable(coins, amounts=[6, 99, 100])
+    print("\nCoinChangeTable (built once up to 100):", table.query_many([6, 99, 100]))
+    print("  after extending to 1000:", table.query(1000), f"(size now {table.size})")
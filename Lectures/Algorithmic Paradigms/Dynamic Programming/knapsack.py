@@ -12,6 +12,14 @@ Recurrence from slide:
              = max{OPT(i-1,w), v_i + OPT(i-1, w-w_i)}     otherwise
 """
 
+from bisect import bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # solve_numpy is optional
+    np = None
+
+
 class Knapsack:
     def __init__(self, weights, values, capacity):
         """
@@ -110,11 +118,235 @@ class Knapsack:
         self.dp = dp
         return dp[self.n][self.capacity]
     
-    def reconstruct_solution(self):
+    def solve_1d(self):
+        """
+        Space-optimized bottom-up DP: one row of size W+1 instead of (n+1) rows.
+
+        Row i only ever reads row i-1, so a single array can be overwritten
+        in place -- as long as w runs from W down to w_i.  Going downwards,
+        dp[w - w_i] has not been updated for item i yet, so it still holds
+        OPT(i-1, w - w_i) and each item is used at most once.
+        (Going upwards would give the unbounded knapsack / coin change.)
+
+        Time O(n*W), space O(W).  Does not keep the table, so it cannot be
+        used by reconstruct_solution(method="table").
+        """
+        dp = [0] * (self.capacity + 1)
+        for item_weight, item_value in zip(self.weights, self.values):
+            for w in range(self.capacity, item_weight - 1, -1):
+                include = item_value + dp[w - item_weight]
+                if include > dp[w]:
+                    dp[w] = include
+        return dp[self.capacity]
+
+    def _best_row(self, items, capacity):
+        """
+        Last row of the DP restricted to the given item indices:
+        row[c] = best value using only those items with weight limit c.
+        Uses NumPy when available.
+        """
+        if np is not None:
+            row = np.zeros(capacity + 1, dtype=np.int64)
+            for idx in items:
+                item_weight, item_value = self.weights[idx], self.values[idx]
+                if item_weight > capacity:
+                    continue
+                if item_weight == 0:
+                    row += max(item_value, 0)
+                    continue
+                # whole row at once: candidate = shifted old row + v_i
+                include = row[:-item_weight] + item_value
+                np.maximum(row[item_weight:], include, out=row[item_weight:])
+            return row
+
+        row = [0] * (capacity + 1)
+        for idx in items:
+            item_weight, item_value = self.weights[idx], self.values[idx]
+            for w in range(capacity, item_weight - 1, -1):
+                include = item_value + row[w - item_weight]
+                if include > row[w]:
+                    row[w] = include
+        return row
+
+    def solve_numpy(self):
+        """
+        Vectorized 1-D DP: each item updates the whole row with one
+        np.maximum(dp[w_i:], dp[:-w_i] + v_i).  The right-hand side is built
+        from the old row before the update, which is what the 0/1 rule needs.
+        """
+        if np is None:
+            raise RuntimeError("solve_numpy needs numpy installed")
+        row = self._best_row(range(self.n), self.capacity)
+        return int(row[self.capacity])
+
+    def solve_hirschberg(self):
+        """
+        Find an optimal item set in O(W) memory (Hirschberg-style divide and conquer).
+
+        Split the items into two halves.  One forward pass gives
+        F[c] = OPT(first half, c) and one pass gives B[c] = OPT(second half, c)
+        for every c.  The best split of the capacity is the c maximizing
+        F[c] + B[W - c]; then solve each half on its own share recursively.
+        Each level of recursion does O(n*W) work, so the total is
+        O(n*W log n) time with only a couple of rows alive at any time.
+
+        Returns:
+            (maximum value, sorted list of selected item indices)
+        """
+        selected = []
+        # explicit stack of (item indices, capacity) subproblems
+        stack = [(list(range(self.n)), self.capacity)]
+        while stack:
+            items, cap = stack.pop()
+            if not items:
+                continue
+            if len(items) == 1:
+                idx = items[0]
+                if self.weights[idx] <= cap and self.values[idx] > 0:
+                    selected.append(idx)
+                continue
+            mid = len(items) // 2
+            left, right = items[:mid], items[mid:]
+            F = self._best_row(left, cap)
+            B = self._best_row(right, cap)
+            if np is not None:
+                best_c = int(np.argmax(F + B[::-1]))
+            else:
+                best_c = max(range(cap + 1), key=lambda c: F[c] + B[cap - c])
+            stack.append((left, best_c))
+            stack.append((right, cap - best_c))
+        selected.sort()
+        return sum(self.values[idx] for idx in selected), selected
+
+    def _pareto(self):
+        """
+        Sparse DP over (weight, value) pairs instead of over every w.
+
+        After processing items 0..i-1 the frontier holds, sorted by weight,
+        only the non-dominated pairs: each one is strictly more valuable than
+        every lighter one.  Adding item i is a linear merge of the frontier
+        with a copy of itself shifted by (w_i, v_i), dropping dominated pairs.
+        The size depends on how many distinct useful sums exist, not on W, so
+        this works for W around 10^9 as long as n is small.
+
+        Each pair carries a shared linked list (item, rest) of the items that
+        built it, so the chosen set can be recovered without storing tables.
+
+        Returns:
+            (maximum value, sorted list of selected item indices)
+        """
+        ws, vs, chains = [0], [0], [None]
+        for idx in range(self.n):
+            item_weight, item_value = self.weights[idx], self.values[idx]
+            if item_weight > self.capacity or item_value <= 0:
+                continue
+            cut = bisect_right(ws, self.capacity - item_weight)
+            new_ws, new_vs, new_chains = [], [], []
+            best = -1
+            i = j = 0
+            while i < len(ws) or j < cut:
+                # take the lighter pair next (on equal weight, the more valuable one)
+                if j >= cut or (i < len(ws) and
+                                (ws[i], -vs[i]) <= (ws[j] + item_weight, -(vs[j] + item_value))):
+                    w, v, chain = ws[i], vs[i], chains[i]
+                    i += 1
+                else:
+                    w, v, chain = ws[j] + item_weight, vs[j] + item_value, (idx, chains[j])
+                    j += 1
+                if v > best:  # otherwise dominated by a lighter pair
+                    best = v
+                    new_ws.append(w)
+                    new_vs.append(v)
+                    new_chains.append(chain)
+            ws, vs, chains = new_ws, new_vs, new_chains
+
+        selected = []
+        chain = chains[-1]  # heaviest pair that fits = most valuable
+        while chain is not None:
+            selected.append(chain[0])
+            chain = chain[1]
+        selected.sort()
+        return vs[-1], selected
+
+    def solve_pareto(self):
+        """Pareto-frontier (dominance list) solver; see _pareto()."""
+        return self._pareto()[0]
+
+    def _half_frontier(self, items):
+        """
+        All 2^len(items) subsets of items as a dominance-pruned list of
+        (weight, value, mask) sorted by weight; mask bit k = items[k] chosen.
+        """
+        subsets = [(0, 0, 0)]
+        for k, idx in enumerate(items):
+            item_weight, item_value, bit = self.weights[idx], self.values[idx], 1 << k
+            subsets += [(w + item_weight, v + item_value, m | bit)
+                        for w, v, m in subsets if w + item_weight <= self.capacity]
+        subsets.sort(key=lambda t: (t[0], -t[1]))
+        frontier = []
+        for entry in subsets:
+            if not frontier or entry[1] > frontier[-1][1]:
+                frontier.append(entry)
+        return frontier
+
+    def _meet_in_middle(self):
+        """
+        Meet in the middle for n <= 40: enumerate each half's subsets
+        (at most 2^20 each), keep each half's Pareto frontier, then pair
+        them with two pointers -- for lighter left subsets, heavier right
+        subsets become affordable.
+
+        Returns:
+            (maximum value, sorted list of selected item indices)
+        """
+        if self.n > 40:
+            raise ValueError("meet in the middle is limited to n <= 40 items")
+        mid = self.n // 2
+        left_items, right_items = list(range(mid)), list(range(mid, self.n))
+        left = self._half_frontier(left_items)
+        right = self._half_frontier(right_items)
+
+        best = (-1, 0, 0)
+        j = len(right) - 1
+        for w, v, mask in left:
+            while right[j][0] > self.capacity - w:
+                j -= 1
+                if j < 0:
+                    break
+            if j < 0:
+                break
+            if v + right[j][1] > best[0]:
+                best = (v + right[j][1], mask, right[j][2])
+
+        value, left_mask, right_mask = best
+        selected = [idx for k, idx in enumerate(left_items) if left_mask >> k & 1]
+        selected += [idx for k, idx in enumerate(right_items) if right_mask >> k & 1]
+        return value, selected
+
+    def solve_meet_in_middle(self):
+        """Meet-in-the-middle solver for n <= 40; see _meet_in_middle()."""
+        return self._meet_in_middle()[0]
+
+    def reconstruct_solution(self, method="table"):
         """
         Reconstruct which items were selected.
-        Requires that solve_bottom_up() was called first.
+
+        Args:
+            method: "table" backtracks through the full dp table
+                    (builds it with solve_bottom_up() if needed);
+                    "hirschberg" uses solve_hirschberg() and O(W) memory;
+                    "pareto" / "mitm" use the sparse solvers, which never
+                    allocate anything of size W
         """
+        if method == "hirschberg":
+            return self.solve_hirschberg()[1]
+        if method == "pareto":
+            return self._pareto()[1]
+        if method == "mitm":
+            return self._meet_in_middle()[1]
+        if method != "table":
+            raise ValueError(f"unknown reconstruction method: {method!r}")
+
         if self.dp is None:
             self.solve_bottom_up()
         
@@ -361,6 +593,51 @@ Coin Change: Can reuse coins → Only need 1D for remaining amount
 """)
 
 
+def demonstrate_space_optimized():
+    """Compare the O(W)-memory solvers with the full table."""
+
+    print("\n" + "="*70)
+    print("SPACE-OPTIMIZED SOLVERS")
+    print("="*70)
+
+    weights = [2, 3, 4, 5]
+    values = [3, 4, 5, 6]
+    capacity = 8
+    knapsack = Knapsack(weights, values, capacity)
+
+    print(f"\nFull table (n+1)x(W+1):   {knapsack.solve_bottom_up()}")
+    print(f"1-D rolling array (W+1):  {knapsack.solve_1d()}")
+    if np is not None:
+        print(f"NumPy row updates:        {knapsack.solve_numpy()}")
+    value, selected = knapsack.solve_hirschberg()
+    print(f"Hirschberg (O(W) memory): {value}, items {selected}")
+    print("""
+Why the 1-D array runs w from W down to w_i:
+    dp[w] = max(dp[w], v_i + dp[w - w_i])
+    w - w_i < w, so going downwards dp[w - w_i] is still the OLD value
+    (row i-1) when we read it -> each item used at most once.
+""")
+
+
+def demonstrate_huge_capacity():
+    """Sparse solvers: capacity in the billions, only a handful of items."""
+
+    print("\n" + "="*70)
+    print("HUGE CAPACITY: PARETO FRONTIER / MEET IN THE MIDDLE")
+    print("="*70)
+
+    weights = [431_000_000, 250_000_000, 612_000_000, 118_000_000, 377_000_000]
+    values = [42, 27, 60, 11, 35]
+    capacity = 1_000_000_000
+    knapsack = Knapsack(weights, values, capacity)
+
+    print(f"\nCapacity W = {capacity:,}  (a table row would need {capacity + 1:,} cells)")
+    print(f"Pareto frontier:      {knapsack.solve_pareto()}, "
+          f"items {knapsack.reconstruct_solution('pareto')}")
+    print(f"Meet in the middle:   {knapsack.solve_meet_in_middle()}, "
+          f"items {knapsack.reconstruct_solution('mitm')}")
+
+
 def main():
     """Run all demonstrations."""
     
@@ -368,6 +645,8 @@ def main():
     trace_recursion_example()
     show_recurrence_explanation()
     compare_with_1d_coin_change()
+    demonstrate_space_optimized()
+    demonstrate_huge_capacity()
     
     print("\n" + "="*70)
     print("KEY TAKEAWAYS")
@@ -387,7 +666,7 @@ def main():
    - OPT(i,w) uses OPT(i-1,w) and OPT(i-1,w-w_i)
 
 4. Time complexity: O(n*W) where n=items, W=capacity
-   Space complexity: O(n*W) for table
+   Space complexity: O(n*W) for table, O(W) with the 1-D rolling array
 
 5. Can reconstruct solution by backtracking through DP table
 """)
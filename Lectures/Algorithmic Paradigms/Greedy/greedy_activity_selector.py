@@ -1,3 +1,8 @@
+import sys
+import time
+from array import array
+
+
 def recursive_activity_selector(s, f, i, n):
     """
     Recursive Activity Selector
@@ -17,8 +22,102 @@ def recursive_activity_selector(s, f, i, n):
         return []
 
 
+def iterative_activity_selector(s, f, i, n):
+    """
+    Same inputs and result as recursive_activity_selector, as one loop:
+    no recursion depth limit and no [m] + list concatenation.
+    """
+    selected = []
+    m = i + 1
+    while m <= n:
+        # Find the next activity that starts after activity i finishes
+        if s[m] >= f[i]:
+            selected.append(m)
+            i = m
+        m += 1
+    return selected
+
+
+def select_activities(activities):
+    """
+    Maximum set of pairwise compatible activities from raw (start, finish)
+    pairs, in any order.
+
+    Sorts a key array of indices by finish time (stable, so ties keep input
+    order), then makes one greedy pass: take an activity whenever it starts
+    no earlier than the last chosen one finishes.
+
+    Args:
+        activities: sequence of (start, finish) pairs
+
+    Returns:
+        array('q') of indices into activities, in order of finish time
+    """
+    n = len(activities)
+    if n == 0:
+        return array('q')
+    starts, finishes = map(list, zip(*activities))
+    order = sorted(range(n), key=finishes.__getitem__)
+    selected = array('q', bytes(8 * n))   # preallocated: at most n picks
+    count = 0
+    last_finish = None
+    for k in order:
+        if last_finish is None or starts[k] >= last_finish:
+            selected[count] = k
+            count += 1
+            last_finish = finishes[k]
+    del selected[count:]
+    return selected
+
+
+def stream_activities(intervals):
+    """
+    Streaming mode: intervals arrive as (start, finish) already sorted by
+    finish time, from any iterator.  Yields (index, (start, finish)) for each
+    selected activity as soon as it is chosen, keeping O(1) state.
+
+    Raises:
+        ValueError: if a finish time goes backwards
+    """
+    last_finish = None
+    prev_finish = None
+    for index, (start, finish) in enumerate(intervals):
+        if prev_finish is not None and finish < prev_finish:
+            raise ValueError(f"interval {index} finishes at {finish}, before {prev_finish}")
+        prev_finish = finish
+        if last_finish is None or start >= last_finish:
+            last_finish = finish
+            yield index, (start, finish)
+
+
+def bench(n=10**6, seed=0):
+    """Time select_activities and stream_activities on n random activities."""
+    import random
+    rng = random.Random(seed)
+    activities = []
+    for _ in range(n):
+        start = rng.randrange(10 * n)
+        activities.append((start, start + rng.randrange(1, 1000)))
+
+    t0 = time.perf_counter()
+    picked = select_activities(activities)
+    t1 = time.perf_counter()
+    activities.sort(key=lambda a: a[1])
+    t2 = time.perf_counter()
+    streamed = sum(1 for _ in stream_activities(iter(activities)))
+    t3 = time.perf_counter()
+    assert streamed == len(picked)
+    print(f"n={n:,}: {len(picked):,} selected")
+    print(f"  select_activities (sort + pass): {t1 - t0:.2f}s")
+    print(f"  stream_activities (pre-sorted):  {t3 - t2:.2f}s")
+
+
 # Example usage
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--bench':
+        bench(int(float(sys.argv[2])) if len(sys.argv) > 2 else 10**6)
+        sys.exit(0)
+
     # Example activities (including dummy 0 at index 0)
     s = [0, 1, 3, 0, 5, 8, 5]   # start times
     f = [0, 2, 4, 6, 7, 9, 9]   # finish times
@@ -27,3 +126,10 @@ if __name__ == "__main__":
     selected = recursive_activity_selector(s, f, 0, n)
     
     print("Selected activities:", selected)
+    print("Iterative selector:  ", iterative_activity_selector(s, f, 0, n))
+
+    # Raw, unsorted (start, finish) pairs: no sentinel, 0-based indices
+    activities = [(5, 9), (1, 2), (0, 6), (8, 9), (3, 4), (5, 7)]
+    print("Unsorted input:      ", list(select_activities(activities)))
+    print("Streaming (sorted):  ",
+          [i for i, _ in stream_activities(sorted(activities, key=lambda a: a[1]))])
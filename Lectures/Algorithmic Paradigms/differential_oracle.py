@@ -0,0 +1,415 @@
+"""
+Differential Testing Oracle
+Cross-check alternative implementations of the same answer and time them.
+
+Several lecture modules solve one problem more than one way:
+    - knapsack.py:                 Knapsack.solve_recursive / solve_bottom_up /
+                                   solve_1d / solve_numpy / solve_hirschberg /
+                                   solve_pareto / solve_meet_in_middle
+    - coin_change.py:              count_ways / count_ways_bottom_up_2d /
+                                   count_ways_1d / count_ways_numpy / count_ways_gf /
+                                   CoinChangeTable
+    - coin_change_problem.py:      count
+    - tiling.py:                   tile_3xn_recursive / tile_3xn_matrix / iter_tilings_3xn /
+                                   count_domino_tilings(3, n)
+    - iterative_complete_search.py: solution1_naive / solution2_optimized / sweep
+    - greedy_activity_selector.py: recursive_activity_selector / iterative_activity_selector /
+                                   select_activities / stream_activities
+    - recursive_backtracking_N_Queens.py: NQueensBacktracking.place_queens / count_solutions
+    - recursive_backtracking_template.py: NQueensBacktrack, SubsetSum.count /
+                                   count_meet_in_middle / iter_subsets,
+                                   GridMaze.bfs / astar, PermutationGenerator.generate /
+                                   iter_permutations / unrank / heap_permutations
+
+A *family* groups implementations that must agree.  The oracle feeds every
+member the same edge cases plus randomized inputs at a sweep of sizes,
+checks that all outputs match the first (reference) implementation, and
+records how long each one took relative to the reference.  A new fast path
+only gets adopted once it has run through here without a mismatch.
+
+Usage:
+    python "Lectures/Algorithmic Paradigms/differential_oracle.py"
+    python "Lectures/Algorithmic Paradigms/differential_oracle.py" knapsack -t 50
+"""
+import argparse
+import contextlib
+import io
+import math
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+for sub in ("Complete Search", "Dynamic Programming", "Greedy"):
+    path = os.path.join(HERE, sub)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+class Mismatch:
+    """One input on which an implementation disagreed with the reference."""
+
+    def __init__(self, family, impl, case, expected, got):
+        self.family = family
+        self.impl = impl
+        self.case = case
+        self.expected = expected
+        self.got = got
+
+    def __repr__(self):
+        return (f"Mismatch({self.family}/{self.impl}: case={self.case!r}, "
+                f"expected={self.expected!r}, got={self.got!r})")
+
+
+class Family:
+    """A set of implementations that must produce the same answer."""
+
+    def __init__(self, name, generate, edge_cases=(), normalize=None, quiet=False):
+        """
+        Args:
+            name: family name used in reports
+            generate: generate(rng, size) -> one input case
+            edge_cases: hand-picked cases always checked first
+            normalize: maps a raw result to a comparable value (default: identity)
+            quiet: swallow anything the implementations print
+        """
+        self.name = name
+        self.generate = generate
+        self.edge_cases = list(edge_cases)
+        self.normalize = normalize or (lambda result: result)
+        self.quiet = quiet
+        self.impls = {}  # impl name -> fn(case); insertion order, first = reference
+
+    def register(self, impl_name, fn):
+        """Add an implementation; the first one registered is the reference."""
+        self.impls[impl_name] = fn
+        return fn
+
+    def run(self, impl_name, case):
+        """Run one implementation on one case, returning (normalized result, seconds)."""
+        fn = self.impls[impl_name]
+        if self.quiet:
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                result = fn(case)
+                elapsed = time.perf_counter() - start
+        else:
+            start = time.perf_counter()
+            result = fn(case)
+            elapsed = time.perf_counter() - start
+        return self.normalize(result), elapsed
+
+
+class DifferentialOracle:
+    """Registry of families plus the checking / timing loop."""
+
+    def __init__(self, seed=0):
+        self.seed = seed
+        self.families = {}
+
+    def family(self, name, generate, edge_cases=(), normalize=None, quiet=False):
+        """Create and register a new family."""
+        fam = Family(name, generate, edge_cases, normalize, quiet)
+        self.families[name] = fam
+        return fam
+
+    def _check_case(self, fam, case, times, mismatches):
+        names = list(fam.impls)
+        expected, elapsed = fam.run(names[0], case)
+        times[names[0]] += elapsed
+        for impl_name in names[1:]:
+            got, elapsed = fam.run(impl_name, case)
+            times[impl_name] += elapsed
+            if got != expected:
+                mismatches.append(Mismatch(fam.name, impl_name, case, expected, got))
+
+    def check(self, name, sizes, trials=20):
+        """
+        Check one family.
+
+        Args:
+            name: family name
+            sizes: input sizes to sweep (passed to the family's generator)
+            trials: random cases per size
+
+        Returns:
+            dict with 'mismatches' (list of Mismatch) and 'sweep', a list of
+            {'size', 'seconds': {impl: total}, 'ratio': {impl: time / reference}}
+        """
+        fam = self.families[name]
+        if len(fam.impls) < 2:
+            raise ValueError(f"family {name!r} needs at least two implementations")
+        rng = random.Random(self.seed)
+        mismatches = []
+
+        edge_times = dict.fromkeys(fam.impls, 0.0)
+        for case in fam.edge_cases:
+            self._check_case(fam, case, edge_times, mismatches)
+
+        reference = next(iter(fam.impls))
+        sweep = []
+        for size in sizes:
+            times = dict.fromkeys(fam.impls, 0.0)
+            for _ in range(trials):
+                self._check_case(fam, fam.generate(rng, size), times, mismatches)
+            ref_time = times[reference] or float('nan')
+            sweep.append({
+                'size': size,
+                'seconds': times,
+                'ratio': {impl: t / ref_time for impl, t in times.items()},
+            })
+        return {'family': name, 'reference': reference,
+                'mismatches': mismatches, 'sweep': sweep}
+
+
+def print_report(report):
+    """Pretty-print the result of DifferentialOracle.check()."""
+    print(f"\n{'='*70}")
+    print(f"FAMILY: {report['family']}  (reference: {report['reference']})")
+    print(f"{'='*70}")
+    for row in report['sweep']:
+        print(f"size={row['size']}")
+        for impl, secs in row['seconds'].items():
+            print(f"  {impl:28s} {secs:10.4f}s   x{row['ratio'][impl]:.2f}")
+    if report['mismatches']:
+        print(f"✗ {len(report['mismatches'])} mismatches, first: {report['mismatches'][0]}")
+    else:
+        print("✓ All implementations agree")
+
+
+# ============================================================================
+# Families for the lecture modules
+# ============================================================================
+
+def _knapsack_case(rng, n):
+    weights = [rng.randint(1, 20) for _ in range(n)]
+    values = [rng.randint(0, 50) for _ in range(n)]
+    return weights, values, rng.randint(0, 5 * n)
+
+
+def _sparse_knapsack_case(rng, n):
+    weights = [rng.randint(1, 4 * 10**8) for _ in range(n)]
+    values = [rng.randint(1, 10**6) for _ in range(n)]
+    return weights, values, 10**9
+
+
+def _coin_case(rng, amount):
+    k = rng.randint(1, 5)
+    coins = sorted(rng.sample(range(1, max(2, amount // 2) + 2), k))
+    return coins, rng.randint(0, amount)
+
+
+def _subset_case(rng, n):
+    numbers = [rng.randint(-10, 10) for _ in range(n)]
+    return numbers, rng.randint(-20, 20)
+
+
+def _maze_case(rng, size):
+    maze = [[1 if rng.random() < 0.3 else 0 for _ in range(size)] for _ in range(size)]
+    maze[0][0] = maze[-1][-1] = 0
+    return maze
+
+
+def _activity_case(rng, n):
+    activities = []
+    for _ in range(n):
+        start = rng.randint(0, 3 * n)
+        activities.append((start, start + rng.randint(0, 10)))
+    return activities
+
+
+def _by_finish(activities):
+    """Indices sorted by finish time plus the lecture's sentinel-padded s, f lists."""
+    order = sorted(range(len(activities)), key=lambda i: activities[i][1])
+    s = [0] + [activities[i][0] for i in order]
+    f = [0] + [activities[i][1] for i in order]
+    return order, s, f
+
+
+def default_oracle(seed=0):
+    """Oracle with every multi-implementation lecture module registered."""
+    from knapsack import Knapsack, np as knapsack_np
+    import coin_change
+    import coin_change_problem
+    import iterative_complete_search as ics
+    import recursive_backtracking_N_Queens as nqueens
+    import recursive_backtracking_template as template
+    import tiling
+    import greedy_activity_selector as greedy
+
+    oracle = DifferentialOracle(seed)
+
+    knap = oracle.family("knapsack", _knapsack_case, edge_cases=[
+        ([], [], 0), ([], [], 10), ([5], [10], 4), ([5], [10], 5), ([1, 1, 1], [0, 0, 0], 3),
+    ])
+    knap.register("solve_bottom_up",
+                  lambda c: Knapsack(*c).solve_bottom_up())
+    knap.register("solve_recursive",
+                  lambda c: Knapsack(*c).solve_recursive(len(c[0]), c[2]))
+    knap.register("solve_1d", lambda c: Knapsack(*c).solve_1d())
+    knap.register("solve_hirschberg", lambda c: Knapsack(*c).solve_hirschberg()[0])
+    if knapsack_np is not None:
+        knap.register("solve_numpy", lambda c: Knapsack(*c).solve_numpy())
+    knap.register("solve_pareto", lambda c: Knapsack(*c).solve_pareto())
+
+    # capacities around 10^9: only the sparse solvers (and the dict memo) can cope
+    sparse = oracle.family("knapsack_sparse", _sparse_knapsack_case, edge_cases=[
+        ([], [], 10**9), ([10**9 + 1], [5], 10**9), ([10**9], [5], 10**9),
+    ])
+    sparse.register("solve_recursive",
+                    lambda c: Knapsack(*c).solve_recursive(len(c[0]), c[2]))
+    sparse.register("solve_pareto", lambda c: Knapsack(*c).solve_pareto())
+    sparse.register("solve_meet_in_middle",
+                    lambda c: Knapsack(*c).solve_meet_in_middle())
+
+    coins = oracle.family("coin_change", _coin_case, edge_cases=[
+        ([], 0), ([], 5), ([1], 0), ([2], 3), ([1, 5, 10, 25], 6),
+    ])
+    coins.register("count_ways_bottom_up_2d",
+                   lambda c: coin_change.count_ways_bottom_up_2d(*c)[0])
+    coins.register("count_ways",
+                   lambda c: coin_change.count_ways(*c)[0])
+    coins.register("coin_change_problem.count",
+                   lambda c: coin_change_problem.count(c[0], len(c[0]) - 1, 0, c[1], {}))
+    coins.register("count_ways_1d", lambda c: coin_change.count_ways_1d(*c))
+    coins.register("count_ways_gf", lambda c: coin_change.count_ways_gf(c[0], [c[1]])[0])
+    coins.register("CoinChangeTable", lambda c: coin_change.CoinChangeTable(c[0]).query(c[1]))
+    if coin_change.np is not None:
+        # answers here are far below the modulus, so they must match exactly
+        coins.register("count_ways_numpy",
+                       lambda c: coin_change.count_ways_numpy(*c, (1 << 61) - 1))
+
+    tilings = oracle.family("tiling_3xn", lambda rng, size: rng.randint(0, size),
+                            edge_cases=[0, 1, 2, 3])
+    tilings.register("tile_3xn_recursive", tiling.tile_3xn_recursive)
+    tilings.register("tile_3xn_matrix", tiling.tile_3xn_matrix)
+    tilings.register("iter_tilings_3xn", lambda n: list(tiling.iter_tilings_3xn(n))[-1])
+    tilings.register("count_domino_tilings", lambda n: tiling.count_domino_tilings(3, n))
+
+    def lecture_queens(n):
+        solver = nqueens.NQueensBacktracking(n)
+        solver.place_queens(1)
+        return len(solver.solutions)
+
+    queens = oracle.family("n_queens", lambda rng, size: rng.randint(1, size),
+                           edge_cases=[1, 2, 3, 4])
+    queens.register("NQueensBacktracking", lecture_queens)
+    queens.register("NQueensBacktrack", lambda n: len(template.NQueensBacktrack(n).solve()))
+    queens.register("count_solutions", lambda n: nqueens.count_solutions(n, processes=1))
+
+    def resolved_after_break(n):
+        # stopping a lazy search early must leave the solver reusable
+        solver = template.NQueensBacktrack(n)
+        for _ in solver.iter_solutions():
+            break
+        for _ in template.BacktrackingEngine(solver).iter_solutions():
+            break
+        return len(solver.solve())
+
+    queens.register("NQueensBacktrack after early stop", resolved_after_break)
+
+    subsets = oracle.family("subset_sum", _subset_case, edge_cases=[
+        ([], 0), ([], 3), ([0, 0], 0), ([-5, 5], 0), ([7], -7),
+    ])
+    subsets.register("SubsetSum.count", lambda c: template.SubsetSum(*c).count())
+    subsets.register("count_meet_in_middle",
+                     lambda c: template.SubsetSum(*c).count_meet_in_middle())
+    subsets.register("iter_subsets",
+                     lambda c: sum(1 for _ in template.SubsetSum(*c).iter_subsets()))
+
+    # BFS and A* may pick different shortest paths: compare lengths
+    mazes = oracle.family("maze_shortest_path", _maze_case,
+                          edge_cases=[[[0]], [[0, 1], [1, 0]], [[0, 0], [0, 0]]],
+                          normalize=lambda path: len(path) if path else None)
+    for method in ("bfs", "astar"):
+        mazes.register(f"GridMaze.{method}",
+                       lambda maze, m=method: getattr(template.GridMaze(maze), m)(
+                           (0, 0), (len(maze) - 1, len(maze) - 1)))
+
+    # Heap's algorithm visits the permutations in another order: compare sorted
+    perms = oracle.family("permutations", lambda rng, size: list(range(rng.randint(0, size))),
+                          edge_cases=[[], [7], [1, 1, 2]], normalize=sorted)
+    perms.register("PermutationGenerator.generate",
+                   lambda items: template.PermutationGenerator(items).generate())
+    perms.register("iter_permutations", lambda items: list(template.iter_permutations(items)))
+    perms.register("unrank", lambda items: [
+        [items[i] for i in template.unrank(r, len(items))] for r in range(math.factorial(len(items)))])
+    perms.register("heap_permutations", lambda items: list(template.heap_permutations(items)))
+
+    def generate_after_break(items):
+        gen = template.PermutationGenerator(items)
+        for _ in template.BacktrackingEngine(gen).iter_solutions():
+            break
+        return gen.generate()
+
+    perms.register("generate after early stop", generate_after_break)
+
+    # answers are indices into the original (unsorted) activity list
+    def lecture_selector(selector):
+        def run(activities):
+            order, s, f = _by_finish(activities)
+            return [order[m - 1] for m in selector(s, f, 0, len(activities))]
+        return run
+
+    def streamed(activities):
+        order, _, _ = _by_finish(activities)
+        return [order[i] for i, _ in greedy.stream_activities(activities[i] for i in order)]
+
+    # start times are >= 0, so the lecture's f[0] = 0 sentinel is harmless
+    activity = oracle.family("activity_selection", _activity_case,
+                             edge_cases=[[], [(0, 0)], [(1, 1), (1, 1)], [(0, 5), (5, 5), (5, 6)]])
+    activity.register("recursive_activity_selector",
+                      lecture_selector(greedy.recursive_activity_selector))
+    activity.register("iterative_activity_selector",
+                      lecture_selector(greedy.iterative_activity_selector))
+    activity.register("select_activities", lambda a: list(greedy.select_activities(a)))
+    activity.register("stream_activities", streamed)
+
+    search = oracle.family("complete_search", lambda rng, size: None,
+                           normalize=set, quiet=True)
+    search.register("solution2_optimized", lambda _: ics.solution2_optimized())
+    search.register("solution1_naive", lambda _: ics.solution1_naive())
+    search.register("sweep", lambda _: ics.sweep())
+    if ics.np is not None:
+        search.register("sweep_numpy", lambda _: ics.sweep(method="numpy"))
+
+    return oracle
+
+
+# default sweeps: (sizes, trials)
+SWEEPS = {
+    "knapsack": ([5, 20, 50, 100], 20),
+    "knapsack_sparse": ([4, 8, 12, 16], 10),
+    "coin_change": ([10, 50, 200, 500], 20),
+    "tiling_3xn": ([10, 100, 400], 20),
+    "n_queens": ([6, 8], 5),
+    "subset_sum": ([5, 10, 16], 20),
+    "maze_shortest_path": ([5, 30, 200], 20),
+    "permutations": ([4, 7], 5),
+    "activity_selection": ([10, 100, 500], 20),
+    "complete_search": ([None], 1),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Differential testing oracle")
+    parser.add_argument("families", nargs="*", help="families to check (default: all)")
+    parser.add_argument("-t", "--trials", type=int, default=None,
+                        help="random cases per size (default: per-family)")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    oracle = default_oracle(args.seed)
+    names = args.families or list(oracle.families)
+    failed = False
+    for name in names:
+        sizes, trials = SWEEPS.get(name, ([10], 20))
+        report = oracle.check(name, sizes, args.trials or trials)
+        print_report(report)
+        failed = failed or bool(report['mismatches'])
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())